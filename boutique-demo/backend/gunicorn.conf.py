@@ -0,0 +1,15 @@
+# Configuration gunicorn pour boutique-demo (chargée automatiquement depuis le répertoire courant)
+import multiprocessing
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+
+# Importe l'application une seule fois dans le maître puis forke les workers
+# (pages de code partagées en copie à l'écriture)
+preload_app = True
+
+# Pas de rechargement ni de journal d'accès en production
+reload = False
+accesslog = None
@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 import uvicorn
 
 app = FastAPI(
     title="EcoAgent Application",
     description="Application générée par EcoAgent Framework",
-    version="1.0.0"
+    version="1.0.0",
+    # Sérialisation JSON via orjson (Rust) plutôt que json de la stdlib
+    default_response_class=ORJSONResponse
 )
 
 app.add_middleware(
@@ -17,7 +23,10 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-@app.get("/")
+# Ajouté en dernier = couche la plus externe : compresse la réponse finale (en-têtes CORS inclus)
+app.add_middleware(GZipMiddleware, minimum_size=500)
+
+@app.get("/", response_model=None)
 async def root():
     return {
         "message": "🚀 EcoAgent Application API",
@@ -25,7 +34,7 @@ async def root():
         "framework": "EcoAgent v2.0"
     }
 
-@app.get("/health")
+@app.get("/health", response_model=None)
 async def health():
     return {"status": "healthy", "service": "ecoagent-app"}
 
@@ -33,4 +42,19 @@ if __name__ == "__main__":
     print("🚀 Démarrage EcoAgent Application")
     print("📡 API disponible sur: http://localhost:8000")
     print("📚 Documentation: http://localhost:8000/docs")
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
+    # Rechargement automatique uniquement en développement (ECOAGENT_DEV=1)
+    dev_mode = os.getenv("ECOAGENT_DEV", "0") == "1"
+    # uvloop / httptools si installés (sinon asyncio / h11) et plusieurs workers pour exploiter tous les cœurs
+    uvicorn.run(
+        "main:app",
+        # Résout "main:app" quel que soit le répertoire courant (chaque worker réimporte le module)
+        app_dir=os.path.dirname(os.path.abspath(__file__)),
+        host="0.0.0.0",
+        port=8000,
+        loop="auto",
+        http="auto",
+        reload=dev_mode,
+        # reload est incompatible avec plusieurs workers
+        workers=1 if dev_mode else int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+        access_log=dev_mode
+    )
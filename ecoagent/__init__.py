@@ -2,11 +2,30 @@
 EcoAgent Framework - Alternative économique aux frameworks multi-agents
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "EcoAgent Team"
 
-from .core.config import config
-from .core.resource_manager import resource_manager  
-from .core.cost_estimator import cost_estimator
+# Chargement paresseux (PEP 562) : les singletons du noyau (détection Ollama,
+# psutil...) ne sont construits qu'au premier accès, pas à l'import du paquet
+_LAZY_ATTRS = {
+    'config': '.core.config',
+    'resource_manager': '.core.resource_manager',
+    'cost_estimator': '.core.cost_estimator',
+}
 
 __all__ = ['config', 'resource_manager', 'cost_estimator']
+
+
+def __getattr__(name):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
@@ -2,16 +2,63 @@
 EcoAgent Agents - Système d'agents collaboratifs
 """
 
-from .base_agent import BaseAgent, AgentStatus
-from .coordinator import AgentCoordinator, coordinator
-from .analysis_agent import AnalysisAgent, analysis_agent
-from .architect_agent import ArchitectAgent, architect_agent
-from .coder_agent import CoderAgent, coder_agent
+import importlib
+import sys
+import types
+
+# Chargement paresseux (PEP 562) : un agent et son singleton ne sont
+# importés qu'au premier accès
+_LAZY_ATTRS = {
+    'BaseAgent': '.base_agent',
+    'AgentStatus': '.base_agent',
+    'TaskRecord': '.base_agent',
+    'AgentCoordinator': '.coordinator',
+    'WorkflowPlan': '.coordinator',
+    'StepResult': '.coordinator',
+    'coordinator': '.coordinator',
+    'AnalysisAgent': '.analysis_agent',
+    'AnalysisResult': '.analysis_agent',
+    'ProjectType': '.analysis_agent',
+    'analysis_agent': '.analysis_agent',
+    'get_analysis_agent': '.analysis_agent',
+    'ArchitectAgent': '.architect_agent',
+    'architect_agent': '.architect_agent',
+    'get_architect_agent': '.architect_agent',
+    'CoderAgent': '.coder_agent',
+    'coder_agent': '.coder_agent',
+}
 
 __all__ = [
-    'BaseAgent', 'AgentStatus',
-    'AgentCoordinator', 'coordinator',
-    'AnalysisAgent', 'analysis_agent',
-    'ArchitectAgent', 'architect_agent',
+    'BaseAgent', 'AgentStatus', 'TaskRecord',
+    'AgentCoordinator', 'WorkflowPlan', 'StepResult', 'coordinator',
+    'AnalysisAgent', 'AnalysisResult', 'ProjectType', 'analysis_agent', 'get_analysis_agent',
+    'ArchitectAgent', 'architect_agent', 'get_architect_agent',
     'CoderAgent', 'coder_agent'
 ]
+
+
+def __getattr__(name):
+    module_path = _LAZY_ATTRS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_path, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_ATTRS))
+
+
+class _AgentsPackage(types.ModuleType):
+    """Empêche l'import d'un sous-module homonyme de masquer son singleton"""
+
+    def __setattr__(self, name, value):
+        # importlib lie ecoagent.agents.<sous-module> sur le paquet ; les
+        # noms analysis_agent, coordinator... désignent les instances
+        if isinstance(value, types.ModuleType) and _LAZY_ATTRS.get(name) == '.' + name:
+            return
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _AgentsPackage
@@ -3,16 +3,288 @@ EcoAgent Framework - Agent d'Analyse
 Premier agent du workflow : analyse les besoins et définit la stratégie
 """
 
+import asyncio
+import copy
+import os
 import re
-from typing import Dict, Any, List
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache, cached_property
+from types import MappingProxyType
+from typing import Dict, Any, List, FrozenSet, ClassVar, Optional, Iterable, Mapping
 from .base_agent import BaseAgent
 
+# Patterns de détection des fonctionnalités, compilés une seule fois
+_FUNC_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'(?:doit|devra|permettre de|capable de)\s+([^.!?]+)',
+    r'(?:créer|afficher|gérer|envoyer|recevoir|calculer|traiter)\s+([^.!?]+)',
+    r'(?:l\'utilisateur peut|on peut|il faut pouvoir)\s+([^.!?]+)'
+)]
+
+# Indicateurs de complexité élevée
+_HIGH_COMPLEXITY_INDICATORS = frozenset((
+    'base de données', 'database', 'api rest', 'microservices',
+    'authentification', 'authentication', 'paiement', 'payment',
+    'temps réel', 'real-time', 'machine learning', 'ia', 'ai',
+    'distributed', 'kubernetes', 'docker', 'cloud'
+))
+
+# Indicateurs de complexité moyenne
+_MEDIUM_COMPLEXITY_INDICATORS = frozenset((
+    'web', 'api', 'backend', 'frontend', 'crud',
+    'formulaire', 'form', 'validation', 'fichier', 'file'
+))
+
+# Indicateurs de simplicité
+_SIMPLE_INDICATORS = frozenset((
+    'simple', 'basic', 'petit', 'small', 'script',
+    'utilitaire', 'utility', 'converter', 'calculatrice'
+))
+
+class ProjectType(IntEnum):
+    """Types de projet ; la valeur indexe les tables _PROJECT_TYPE_*"""
+    WEB_APPLICATION = 0
+    API = 1
+    MOBILE_APP = 2
+    DESKTOP_APP = 3
+    SCRIPT = 4
+    LIBRARY = 5
+    DATA_ANALYSIS = 6
+    GAME = 7
+    DOCUMENTATION = 8
+    GENERAL_APPLICATION = 9
+
+
+# Libellé exposé dans les résultats (indexé par ProjectType)
+_PROJECT_TYPE_NAMES = tuple(member.name.lower() for member in ProjectType)
+
+# Indicateurs de type de projet, par ordre de priorité
+_TYPE_INDICATORS = (
+    (ProjectType.WEB_APPLICATION, frozenset(('web app', 'site web', 'application web', 'webapp', 'website'))),
+    (ProjectType.API, frozenset(('api', 'rest', 'endpoint', 'microservice'))),
+    (ProjectType.MOBILE_APP, frozenset(('mobile', 'app mobile', 'android', 'ios', 'smartphone'))),
+    (ProjectType.DESKTOP_APP, frozenset(('desktop', 'application bureau', 'gui', 'interface graphique'))),
+    (ProjectType.SCRIPT, frozenset(('script', 'automation', 'batch', 'utilitaire'))),
+    (ProjectType.LIBRARY, frozenset(('bibliothèque', 'library', 'package', 'module'))),
+    (ProjectType.DATA_ANALYSIS, frozenset(('analyse de données', 'data analysis', 'statistiques', 'dashboard'))),
+    (ProjectType.GAME, frozenset(('jeu', 'game', 'gaming'))),
+    (ProjectType.DOCUMENTATION, frozenset(('documentation', 'doc', 'readme', 'guide')))
+)
+
+_TECH_KEYWORDS = (
+    'python', 'javascript', 'react', 'vue', 'angular', 'django', 'flask',
+    'fastapi', 'postgresql', 'mysql', 'mongodb', 'redis', 'docker',
+    'kubernetes', 'aws', 'azure', 'gcp', 'rest api', 'graphql'
+)
+
+_PERFORMANCE_KEYWORDS = ('rapide', 'performant', 'temps réel', 'scalable', 'responsive')
+
+# Étapes du plan d'action (lecture seule) ; chaque plan en reçoit des copies modifiables
+_STEP_ANALYSIS = MappingProxyType({'step': 'Analyse', 'description': 'Analyse des besoins et définition des exigences', 'status': 'completed'})
+_STEP_ARCHITECTURE = MappingProxyType({'step': 'Architecture', 'description': 'Conception de l\'architecture et choix techniques', 'status': 'pending'})
+_STEP_PROTOTYPE = MappingProxyType({'step': 'Prototypage', 'description': 'Création d\'un prototype pour validation', 'status': 'pending'})
+_STEP_DEVELOPMENT = MappingProxyType({'step': 'Développement', 'description': 'Implémentation du code principal', 'status': 'pending'})
+_STEP_FRONTEND = MappingProxyType({'step': 'Frontend', 'description': 'Développement de l\'interface utilisateur', 'status': 'pending'})
+_STEP_BACKEND = MappingProxyType({'step': 'Backend', 'description': 'Développement de la logique serveur', 'status': 'pending'})
+_STEP_TESTS = MappingProxyType({'step': 'Tests', 'description': 'Tests unitaires et d\'intégration', 'status': 'pending'})
+_STEP_DOCUMENTATION = MappingProxyType({'step': 'Documentation', 'description': 'Documentation du code et guide utilisateur', 'status': 'pending'})
+_STEP_DEPLOYMENT = MappingProxyType({'step': 'Déploiement', 'description': 'Configuration et déploiement en production', 'status': 'pending'})
+
+# Estimations de base par complexité
+_BASE_ESTIMATES = {
+    'simple': {'time_hours': 2, 'agents_needed': 2, 'cost_euros': 0.0},
+    'medium': {'time_hours': 8, 'agents_needed': 4, 'cost_euros': 0.02},
+    'complex': {'time_hours': 24, 'agents_needed': 6, 'cost_euros': 0.10}
+}
+
+# Ajustements des estimations, indexés par ProjectType
+_PROJECT_TYPE_MULTIPLIERS = (
+    1.2,  # WEB_APPLICATION
+    0.8,  # API
+    1.5,  # MOBILE_APP
+    1.0,  # DESKTOP_APP
+    0.5,  # SCRIPT
+    1.0,  # LIBRARY
+    1.0,  # DATA_ANALYSIS
+    1.0,  # GAME
+    0.3,  # DOCUMENTATION
+    1.0   # GENERAL_APPLICATION
+)
+
+_DEFAULT_TECH_SUGGESTION = MappingProxyType({
+    'language': 'Python',
+    'framework': 'À déterminer selon les besoins'
+})
+
+# Piles technologiques suggérées (lecture seule), indexées par ProjectType
+_PROJECT_TYPE_TECH_STACKS = (
+    MappingProxyType({  # WEB_APPLICATION
+        'backend': 'FastAPI ou Django',
+        'frontend': 'React ou Vue.js',
+        'database': 'PostgreSQL',
+        'deployment': 'Docker + Cloud provider'
+    }),
+    MappingProxyType({  # API
+        'framework': 'FastAPI',
+        'database': 'PostgreSQL ou MongoDB',
+        'authentication': 'JWT',
+        'documentation': 'OpenAPI/Swagger'
+    }),
+    _DEFAULT_TECH_SUGGESTION,  # MOBILE_APP
+    _DEFAULT_TECH_SUGGESTION,  # DESKTOP_APP
+    MappingProxyType({  # SCRIPT
+        'language': 'Python',
+        'dependencies': 'Minimal',
+        'distribution': 'pip package'
+    }),
+    _DEFAULT_TECH_SUGGESTION,  # LIBRARY
+    _DEFAULT_TECH_SUGGESTION,  # DATA_ANALYSIS
+    _DEFAULT_TECH_SUGGESTION,  # GAME
+    MappingProxyType({  # DOCUMENTATION
+        'format': 'Markdown',
+        'generator': 'MkDocs ou Sphinx',
+        'hosting': 'GitHub Pages'
+    }),
+    _DEFAULT_TECH_SUGGESTION  # GENERAL_APPLICATION
+)
+
+# Union dédoublonnée de tous les mots-clés : chacun n'est cherché qu'une fois par tâche
+_ALL_KEYWORDS = tuple(
+    _HIGH_COMPLEXITY_INDICATORS.union(
+        _MEDIUM_COMPLEXITY_INDICATORS, _SIMPLE_INDICATORS,
+        _TECH_KEYWORDS, _PERFORMANCE_KEYWORDS,
+        *(indicators for _, indicators in _TYPE_INDICATORS)
+    )
+)
+
+
+def _match_keywords(description_lower: str) -> FrozenSet[str]:
+    """Mots-clés présents (en sous-chaîne) dans la description, en une seule passe sur l'index"""
+    return frozenset(keyword for keyword in _ALL_KEYWORDS if keyword in description_lower)
+
+
+# En dessous de ce nombre de descriptions, le parcours individuel est plus rapide
+_BATCH_MIN_SIZE = 8
+
+
+def _match_keywords_batch(descriptions_lower: List[str]) -> List[FrozenSet[str]]:
+    """
+    Équivalent groupé de _match_keywords : les descriptions sont jointes par un
+    séparateur et chaque mot-clé est cherché une fois dans le texte joint ; la
+    tâche d'une occurrence est retrouvée par bisection sur les bornes
+    """
+    joined = "\x00".join(descriptions_lower)
+    # ends[i] = position du séparateur qui suit la description i
+    ends = []
+    position = -1
+    for description_lower in descriptions_lower:
+        position += len(description_lower) + 1
+        ends.append(position)
+    
+    matches = [set() for _ in descriptions_lower]
+    for keyword in _ALL_KEYWORDS:
+        start = joined.find(keyword)
+        while start != -1:
+            index = bisect_right(ends, start)
+            matches[index].add(keyword)
+            # Une occurrence suffit : on reprend à la description suivante
+            start = joined.find(keyword, ends[index] + 1)
+    return [frozenset(found) for found in matches]
+
+@dataclass(eq=False)
+class AnalysisResult:
+    """
+    Résultat d'analyse paresseux : chaque champ n'est calculé qu'au premier accès
+    puis mémorisé, ce qui évite les estimateurs dont l'appelant n'a pas besoin
+    """
+    agent: 'AnalysisAgent' = field(repr=False)
+    description: str
+    
+    FIELDS: ClassVar[tuple] = (
+        'project_type', 'complexity', 'requirements', 'action_plan',
+        'resource_estimate', 'suggestions', 'recommended_workflow',
+        'technical_stack', 'risk_assessment'
+    )
+    
+    @cached_property
+    def description_lower(self) -> str:
+        return self.description.lower()
+    
+    @cached_property
+    def matched(self) -> FrozenSet[str]:
+        # Recherche unique des mots-clés, partagée par les classifieurs
+        return _match_keywords(self.description_lower)
+    
+    @cached_property
+    def complexity(self) -> str:
+        return self.agent._assess_complexity(self.description, self.matched)
+    
+    @cached_property
+    def project_kind(self) -> ProjectType:
+        return self.agent._detect_project_type(self.matched)
+    
+    @cached_property
+    def project_type(self) -> str:
+        return _PROJECT_TYPE_NAMES[self.project_kind]
+    
+    @cached_property
+    def requirements(self) -> Dict[str, List[str]]:
+        return self.agent._extract_requirements(self.description, self.matched)
+    
+    @cached_property
+    def action_plan(self) -> List[Dict[str, str]]:
+        return self.agent._generate_action_plan(self.project_type, self.complexity, self.requirements)
+    
+    @cached_property
+    def resource_estimate(self) -> Dict[str, Any]:
+        return self.agent._estimate_resources(self.project_kind, self.complexity)
+    
+    @cached_property
+    def suggestions(self) -> List[str]:
+        return self.agent._generate_suggestions(self.description_lower, self.project_type)
+    
+    @cached_property
+    def recommended_workflow(self) -> str:
+        return self.agent._recommend_workflow(self.project_type, self.complexity)
+    
+    @cached_property
+    def technical_stack(self) -> Dict[str, str]:
+        return self.agent._suggest_tech_stack(self.project_kind)
+    
+    @cached_property
+    def risk_assessment(self) -> List[Dict[str, str]]:
+        return self.agent._assess_risks(self.project_type, self.complexity)
+    
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Sérialise le résultat ; `fields` limite le calcul aux champs demandés
+        Les valeurs sont copiées : l'appelant peut les modifier sans altérer le cache
+        """
+        names = self.FIELDS if fields is None else [name for name in self.FIELDS if name in fields]
+        result = {'success': True}
+        for name in names:
+            result[name] = copy.deepcopy(getattr(self, name))
+        return result
+
 class AnalysisAgent(BaseAgent):
     """
     Agent d'analyse des besoins
     Point d'entrée de tous les workflows de développement
     """
     
+    __slots__ = ('specialized_model', '_analyze_cached')
+    
+    # Templates d'analyse (constants, partagés par toutes les instances)
+    analysis_templates: ClassVar[Dict[str, str]] = {
+        'web_app': "Template pour applications web...",
+        'bug_fix': "Template pour correction de bugs...",
+        'refactoring': "Template pour refactoring...",
+        'documentation': "Template pour documentation...",
+        'simple_task': "Template pour tâches simples..."
+    }
+    
     def __init__(self):
         super().__init__(
             name="analysis",
@@ -23,85 +295,82 @@ class AnalysisAgent(BaseAgent):
         # Spécialisation pour l'analyse
         self.specialized_model = "primary_model"  # Utilise le meilleur modèle disponible
         
-        # Templates d'analyse
-        self.analysis_templates = {
-            'web_app': self._web_app_analysis_template(),
-            'bug_fix': self._bug_fix_analysis_template(),
-            'refactoring': self._refactoring_analysis_template(),
-            'documentation': self._documentation_analysis_template(),
-            'simple_task': self._simple_task_analysis_template()
-        }
+        # Cache par instance : l'analyse ne dépend que de la description
+        self._analyze_cached = lru_cache(maxsize=1024)(self._analyze)
     
     async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """
         Analyse une demande de développement et produit un plan détaillé
+        L'analyse est purement CPU : elle s'exécute hors de la boucle d'événements
         """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.execute_task_sync, task)
+    
+    def execute_task_sync(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Version synchrone de execute_task, utilisable sans boucle d'événements"""
         description = task.get('description', '')
         task_type = task.get('type', 'analysis')
         context = task.get('context', {})
         
-        self.logger.info(f"Analyse de la demande: {description[:100]}...")
-        
-        # Analyse de la complexité
-        complexity = self._assess_complexity(description)
-        
-        # Détection du type de projet
-        project_type = self._detect_project_type(description)
+        self.logger.info("Analyse de la demande: %.100s...", description)
         
-        # Extraction des exigences
-        requirements = self._extract_requirements(description)
-        
-        # Génération du plan d'action
-        action_plan = self._generate_action_plan(project_type, complexity, requirements)
+        # task['fields'] restreint les champs calculés ; to_dict renvoie une copie
+        # indépendante du résultat mis en cache
+        return self._analyze_cached(description).to_dict(task.get('fields'))
+    
+    def execute_tasks_batch(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyse un lot de demandes ; la recherche de mots-clés est mutualisée
+        sur l'ensemble du lot au-delà de _BATCH_MIN_SIZE descriptions
+        """
+        if len(tasks) < _BATCH_MIN_SIZE:
+            return [self.execute_task_sync(task) for task in tasks]
         
-        # Estimation des ressources
-        resource_estimate = self._estimate_resources(project_type, complexity)
+        self.logger.info("Analyse groupée de %d demandes", len(tasks))
         
-        # Suggestions d'amélioration
-        suggestions = self._generate_suggestions(description, project_type)
+        results = [self._analyze_cached(task.get('description', '')) for task in tasks]
         
-        analysis_result = {
-            'success': True,
-            'project_type': project_type,
-            'complexity': complexity,
-            'requirements': requirements,
-            'action_plan': action_plan,
-            'resource_estimate': resource_estimate,
-            'suggestions': suggestions,
-            'recommended_workflow': self._recommend_workflow(project_type, complexity),
-            'technical_stack': self._suggest_tech_stack(project_type, requirements),
-            'risk_assessment': self._assess_risks(project_type, complexity)
-        }
+        # Seuls les résultats dont les mots-clés n'ont pas encore été calculés
+        pending = list({id(result): result for result in results
+                        if 'matched' not in result.__dict__}.values())
+        if pending:
+            matches = _match_keywords_batch([result.description_lower for result in pending])
+            for result, matched in zip(pending, matches):
+                # Pré-remplit la cached_property
+                result.__dict__['matched'] = matched
         
-        return analysis_result
+        return [result.to_dict(task.get('fields')) for result, task in zip(results, tasks)]
     
-    def _assess_complexity(self, description: str) -> str:
+    async def execute_tasks(self, tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Analyse asynchrone d'un lot ; au-delà de _PROCESS_POOL_MIN_TASKS demandes,
+        le lot est réparti sur un pool de processus (contourne le GIL)
+        """
+        loop = asyncio.get_running_loop()
+        if len(tasks) < _PROCESS_POOL_MIN_TASKS:
+            # Petit lot : le coût de sérialisation vers des processus ne se rentabilise pas
+            return await loop.run_in_executor(None, self.execute_tasks_batch, tasks)
+        
+        pool = _get_process_pool()
+        chunk_size = -(-len(tasks) // _PROCESS_POOL_WORKERS)
+        chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+        self.logger.info("Analyse de %d demandes sur %d processus", len(tasks), len(chunks))
+        
+        chunk_results = await asyncio.gather(*(
+            loop.run_in_executor(pool, _analyze_chunk_in_worker, chunk) for chunk in chunks
+        ))
+        return [result for chunk in chunk_results for result in chunk]
+    
+    def _analyze(self, description: str) -> 'AnalysisResult':
+        """Résultat paresseux d'une description (mis en cache par execute_task_sync)"""
+        return AnalysisResult(self, description)
+    
+    def _assess_complexity(self, description: str, matched: FrozenSet[str]) -> str:
         """Évalue la complexité du projet"""
-        description_lower = description.lower()
-        
-        # Indicateurs de complexité élevée
-        high_complexity_indicators = [
-            'base de données', 'database', 'api rest', 'microservices',
-            'authentification', 'authentication', 'paiement', 'payment',
-            'temps réel', 'real-time', 'machine learning', 'ia', 'ai',
-            'distributed', 'kubernetes', 'docker', 'cloud'
-        ]
-        
-        # Indicateurs de complexité moyenne
-        medium_complexity_indicators = [
-            'web', 'api', 'backend', 'frontend', 'crud',
-            'formulaire', 'form', 'validation', 'fichier', 'file'
-        ]
-        
-        # Indicateurs de simplicité
-        simple_indicators = [
-            'simple', 'basic', 'petit', 'small', 'script',
-            'utilitaire', 'utility', 'converter', 'calculatrice'
-        ]
-        
-        high_score = sum(1 for indicator in high_complexity_indicators if indicator in description_lower)
-        medium_score = sum(1 for indicator in medium_complexity_indicators if indicator in description_lower)
-        simple_score = sum(1 for indicator in simple_indicators if indicator in description_lower)
+        # Intersections d'ensembles : sondage de hash en C plutôt qu'une boucle Python
+        high_score = len(_HIGH_COMPLEXITY_INDICATORS & matched)
+        medium_score = len(_MEDIUM_COMPLEXITY_INDICATORS & matched)
+        simple_score = len(_SIMPLE_INDICATORS & matched)
         
         if high_score >= 2:
             return 'complex'
@@ -113,66 +382,28 @@ class AnalysisAgent(BaseAgent):
             # Par défaut, basé sur la longueur de la description
             return 'medium' if len(description) > 200 else 'simple'
     
-    def _detect_project_type(self, description: str) -> str:
+    def _detect_project_type(self, matched: FrozenSet[str]) -> ProjectType:
         """Détecte le type de projet basé sur la description"""
-        description_lower = description.lower()
-        
-        type_indicators = {
-            'web_application': ['web app', 'site web', 'application web', 'webapp', 'website'],
-            'api': ['api', 'rest', 'endpoint', 'microservice'],
-            'mobile_app': ['mobile', 'app mobile', 'android', 'ios', 'smartphone'],
-            'desktop_app': ['desktop', 'application bureau', 'gui', 'interface graphique'],
-            'script': ['script', 'automation', 'batch', 'utilitaire'],
-            'library': ['bibliothèque', 'library', 'package', 'module'],
-            'data_analysis': ['analyse de données', 'data analysis', 'statistiques', 'dashboard'],
-            'game': ['jeu', 'game', 'gaming'],
-            'documentation': ['documentation', 'doc', 'readme', 'guide']
-        }
-        
-        for project_type, indicators in type_indicators.items():
-            if any(indicator in description_lower for indicator in indicators):
+        for project_type, indicators in _TYPE_INDICATORS:
+            if not indicators.isdisjoint(matched):
                 return project_type
         
-        return 'general_application'
+        return ProjectType.GENERAL_APPLICATION
     
-    def _extract_requirements(self, description: str) -> Dict[str, List[str]]:
+    def _extract_requirements(self, description: str, matched: FrozenSet[str]) -> Dict[str, List[str]]:
         """Extrait les exigences fonctionnelles et techniques"""
         
         # Exigences fonctionnelles (ce que doit faire l'application)
         functional_requirements = []
         
-        # Patterns pour détecter les fonctionnalités
-        functionality_patterns = [
-            r'(?:doit|devra|permettre de|capable de)\s+([^.!?]+)',
-            r'(?:créer|afficher|gérer|envoyer|recevoir|calculer|traiter)\s+([^.!?]+)',
-            r'(?:l\'utilisateur peut|on peut|il faut pouvoir)\s+([^.!?]+)'
-        ]
-        
-        for pattern in functionality_patterns:
-            matches = re.findall(pattern, description, re.IGNORECASE)
-            functional_requirements.extend(matches)
+        for pattern in _FUNC_PATTERNS:
+            functional_requirements.extend(pattern.findall(description))
         
         # Exigences techniques (technologies, contraintes)
-        technical_requirements = []
-        
-        tech_keywords = [
-            'python', 'javascript', 'react', 'vue', 'angular', 'django', 'flask',
-            'fastapi', 'postgresql', 'mysql', 'mongodb', 'redis', 'docker',
-            'kubernetes', 'aws', 'azure', 'gcp', 'rest api', 'graphql'
-        ]
-        
-        description_lower = description.lower()
-        for keyword in tech_keywords:
-            if keyword in description_lower:
-                technical_requirements.append(keyword)
+        technical_requirements = [keyword for keyword in _TECH_KEYWORDS if keyword in matched]
         
         # Exigences de performance
-        performance_requirements = []
-        performance_keywords = ['rapide', 'performant', 'temps réel', 'scalable', 'responsive']
-        
-        for keyword in performance_keywords:
-            if keyword in description_lower:
-                performance_requirements.append(keyword)
+        performance_requirements = [keyword for keyword in _PERFORMANCE_KEYWORDS if keyword in matched]
         
         return {
             'functional': functional_requirements[:10],  # Limite à 10 éléments
@@ -181,75 +412,39 @@ class AnalysisAgent(BaseAgent):
         }
     
     def _generate_action_plan(self, project_type: str, complexity: str, requirements: Dict[str, List[str]]) -> List[Dict[str, str]]:
-        """Génère un plan d'action détaillé"""
-        
-        base_steps = [
-            {'step': 'Analyse', 'description': 'Analyse des besoins et définition des exigences', 'status': 'completed'},
-            {'step': 'Architecture', 'description': 'Conception de l\'architecture et choix techniques', 'status': 'pending'},
-            {'step': 'Développement', 'description': 'Implémentation du code principal', 'status': 'pending'},
-            {'step': 'Tests', 'description': 'Tests unitaires et d\'intégration', 'status': 'pending'},
-            {'step': 'Documentation', 'description': 'Documentation du code et guide utilisateur', 'status': 'pending'}
-        ]
-        
-        # Ajout d'étapes spécifiques selon le type de projet
-        if project_type == 'web_application':
-            base_steps.insert(3, {
-                'step': 'Frontend', 
-                'description': 'Développement de l\'interface utilisateur',
-                'status': 'pending'
-            })
-            base_steps.insert(4, {
-                'step': 'Backend', 
-                'description': 'Développement de la logique serveur',
-                'status': 'pending'
-            })
-        
-        if complexity == 'complex':
-            base_steps.insert(2, {
-                'step': 'Prototypage',
-                'description': 'Création d\'un prototype pour validation',
-                'status': 'pending'
-            })
-            base_steps.append({
-                'step': 'Déploiement',
-                'description': 'Configuration et déploiement en production',
-                'status': 'pending'
-            })
-        
-        return base_steps
+        """Génère un plan d'action détaillé (une copie de chaque étape, propre au plan)"""
+        prototype = [_STEP_PROTOTYPE] if complexity == 'complex' else []
+        web_layers = [_STEP_FRONTEND, _STEP_BACKEND] if project_type == 'web_application' else []
+        deployment = [_STEP_DEPLOYMENT] if complexity == 'complex' else []
+        
+        steps = (
+            [_STEP_ANALYSIS, _STEP_ARCHITECTURE] + prototype + [_STEP_DEVELOPMENT]
+            + web_layers + [_STEP_TESTS, _STEP_DOCUMENTATION] + deployment
+        )
+        return [dict(step) for step in steps]
     
-    def _estimate_resources(self, project_type: str, complexity: str) -> Dict[str, Any]:
-        """Estime les ressources nécessaires"""
-        
-        base_estimates = {
-            'simple': {'time_hours': 2, 'agents_needed': 2, 'cost_euros': 0.0},
-            'medium': {'time_hours': 8, 'agents_needed': 4, 'cost_euros': 0.02},
-            'complex': {'time_hours': 24, 'agents_needed': 6, 'cost_euros': 0.10}
-        }
-        
-        estimate = base_estimates.get(complexity, base_estimates['medium']).copy()
+    @staticmethod
+    def _estimate_resources(project_type: ProjectType, complexity: str) -> Dict[str, Any]:
+        """Estime les ressources nécessaires (copie de l'estimation mise en cache)"""
+        return dict(AnalysisAgent._estimate_resources_cached(project_type, complexity))
+    
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _estimate_resources_cached(project_type: ProjectType, complexity: str) -> Mapping[str, Any]:
+        """Estimation par (type, complexité), calculée une fois et en lecture seule"""
+        estimate = dict(_BASE_ESTIMATES.get(complexity, _BASE_ESTIMATES['medium']))
         
         # Ajustements selon le type de projet
-        multipliers = {
-            'web_application': 1.2,
-            'mobile_app': 1.5,
-            'api': 0.8,
-            'script': 0.5,
-            'documentation': 0.3
-        }
-        
-        multiplier = multipliers.get(project_type, 1.0)
+        multiplier = _PROJECT_TYPE_MULTIPLIERS[project_type]
         estimate['time_hours'] = int(estimate['time_hours'] * multiplier)
         estimate['cost_euros'] = round(estimate['cost_euros'] * multiplier, 4)
         
-        return estimate
+        return MappingProxyType(estimate)
     
-    def _generate_suggestions(self, description: str, project_type: str) -> List[str]:
-        """Génère des suggestions d'amélioration"""
+    def _generate_suggestions(self, description_lower: str, project_type: str) -> List[str]:
+        """Génère des suggestions d'amélioration (description déjà en minuscules)"""
         suggestions = []
         
-        description_lower = description.lower()
-        
         # Suggestions basées sur les bonnes pratiques
         if 'test' not in description_lower:
             suggestions.append("Ajout de tests automatisés recommandé pour assurer la qualité")
@@ -268,7 +463,9 @@ class AnalysisAgent(BaseAgent):
         
         return suggestions
     
-    def _recommend_workflow(self, project_type: str, complexity: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _recommend_workflow(project_type: str, complexity: str) -> str:
         """Recommande le type de workflow optimal"""
         
         if complexity == 'complex':
@@ -282,38 +479,10 @@ class AnalysisAgent(BaseAgent):
         else:
             return 'simple_task'
     
-    def _suggest_tech_stack(self, project_type: str, requirements: Dict[str, List[str]]) -> Dict[str, str]:
-        """Suggère une pile technologique appropriée"""
-        
-        tech_suggestions = {
-            'web_application': {
-                'backend': 'FastAPI ou Django',
-                'frontend': 'React ou Vue.js',
-                'database': 'PostgreSQL',
-                'deployment': 'Docker + Cloud provider'
-            },
-            'api': {
-                'framework': 'FastAPI',
-                'database': 'PostgreSQL ou MongoDB',
-                'authentication': 'JWT',
-                'documentation': 'OpenAPI/Swagger'
-            },
-            'script': {
-                'language': 'Python',
-                'dependencies': 'Minimal',
-                'distribution': 'pip package'
-            },
-            'documentation': {
-                'format': 'Markdown',
-                'generator': 'MkDocs ou Sphinx',
-                'hosting': 'GitHub Pages'
-            }
-        }
-        
-        return tech_suggestions.get(project_type, {
-            'language': 'Python',
-            'framework': 'À déterminer selon les besoins'
-        })
+    @staticmethod
+    def _suggest_tech_stack(project_type: ProjectType) -> Dict[str, str]:
+        """Suggère une pile technologique appropriée (copie propre à l'appelant)"""
+        return dict(_PROJECT_TYPE_TECH_STACKS[project_type])
     
     def _assess_risks(self, project_type: str, complexity: str) -> List[Dict[str, str]]:
         """Évalue les risques potentiels"""
@@ -348,22 +517,35 @@ class AnalysisAgent(BaseAgent):
     def estimate_task_cost(self, task: Dict[str, Any]) -> float:
         """L'analyse est toujours gratuite avec Ollama"""
         return 0.0
-    
-    # Templates privés pour différents types d'analyse
-    def _web_app_analysis_template(self):
-        return "Template pour applications web..."
-    
-    def _bug_fix_analysis_template(self):
-        return "Template pour correction de bugs..."
-    
-    def _refactoring_analysis_template(self):
-        return "Template pour refactoring..."
-    
-    def _documentation_analysis_template(self):
-        return "Template pour documentation..."
-    
-    def _simple_task_analysis_template(self):
-        return "Template pour tâches simples..."
 
-# Instance de l'agent d'analyse
-analysis_agent = AnalysisAgent()
+# Taille de lot à partir de laquelle execute_tasks utilise des processus
+_PROCESS_POOL_MIN_TASKS = 64
+_PROCESS_POOL_WORKERS = os.cpu_count() or 1
+
+_process_pool = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Pool de processus partagé, créé au premier lot volumineux"""
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=_PROCESS_POOL_WORKERS)
+    return _process_pool
+
+
+def _analyze_chunk_in_worker(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Point d'entrée des processus du pool (fonction de module, donc sérialisable)"""
+    return get_analysis_agent().execute_tasks_batch(tasks)
+
+
+@lru_cache(maxsize=None)
+def get_analysis_agent() -> AnalysisAgent:
+    """Instance partagée de l'agent d'analyse, créée au premier appel"""
+    return AnalysisAgent()
+
+
+def __getattr__(name):
+    # Compatibilité : `from .analysis_agent import analysis_agent` reste valide
+    if name == 'analysis_agent':
+        return get_analysis_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,18 +4,38 @@ Classe abstraite pour tous les agents du système
 """
 
 import logging
+import sys
 import time
+from collections import deque
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional, Union
-from enum import Enum
+from typing import Dict, Any, List, Optional, Union, Deque, NamedTuple
+from enum import IntEnum
 
-class AgentStatus(Enum):
-    """États possibles d'un agent"""
-    IDLE = "idle"
-    WORKING = "working"
-    WAITING = "waiting"
-    ERROR = "error"
-    COMPLETED = "completed"
+class AgentStatus(IntEnum):
+    """
+    États possibles d'un agent
+    Valeurs entières (écritures/comparaisons rapides) ; le libellé exposé est `label`
+    """
+    IDLE = 0
+    WORKING = 1
+    WAITING = 2
+    ERROR = 3
+    COMPLETED = 4
+    
+    @property
+    def label(self) -> str:
+        """Libellé sérialisé : 'idle', 'working', ..."""
+        return _STATUS_LABELS[self]
+
+_STATUS_LABELS = tuple(status.name.lower() for status in AgentStatus)
+
+class TaskRecord(NamedTuple):
+    """Entrée de l'historique des tâches (plus compacte qu'un dict)"""
+    success: bool
+    duration: float
+    cost: float
+    timestamp: float
+    task_id: Any
 
 class BaseAgent(ABC):
     """
@@ -23,6 +43,20 @@ class BaseAgent(ABC):
     Implémente les fonctionnalités communes et l'interface standard
     """
     
+    # Pas de __dict__ par instance : accès aux attributs par index et empreinte réduite
+    __slots__ = (
+        'name', 'description', 'model_preference', 'status', 'logger',
+        'creation_time', 'last_activity', 'task_history', 'current_task',
+        'total_tasks', 'successful_tasks', 'failed_tasks', 'total_cost_euros',
+        '_model_config_cache', '_model_config_version', '_duration_sum',
+        # Référençable faiblement (registre d'agents du coordinateur)
+        '__weakref__'
+    )
+    
+    # False pour les agents purement CPU : start_task appelle alors directement
+    # execute_task_sync, sans créer de coroutine
+    IS_ASYNC = True
+    
     def __init__(self, 
                  name: str, 
                  description: str,
@@ -35,7 +69,8 @@ class BaseAgent(ABC):
             description: Description de la fonction de l'agent
             model_preference: "local" (Ollama prioritaire) ou "api" (API prioritaire)
         """
-        self.name = name
+        # Nom interné : partagé avec les clés de registre et les noms de logger
+        self.name = sys.intern(name)
         self.description = description
         self.model_preference = model_preference
         self.status = AgentStatus.IDLE
@@ -45,8 +80,10 @@ class BaseAgent(ABC):
         self.creation_time = time.time()
         self.last_activity = time.time()
         
-        # Historique des tâches
-        self.task_history: List[Dict[str, Any]] = []
+        # Historique des tâches, limité aux 100 dernières entrées (éviction en O(1))
+        self.task_history: Deque[TaskRecord] = deque(maxlen=100)
+        # Somme glissante des durées de l'historique : moyenne en O(1)
+        self._duration_sum = 0.0
         self.current_task: Optional[Dict[str, Any]] = None
         
         # Métriques
@@ -55,7 +92,11 @@ class BaseAgent(ABC):
         self.failed_tasks = 0
         self.total_cost_euros = 0.0
         
-        self.logger.info(f"Agent {self.name} initialisé")
+        # Cache de get_model_config, invalidé par resource_manager.config_version
+        self._model_config_cache: Optional[Dict[str, Any]] = None
+        self._model_config_version = -1
+        
+        self.logger.info("Agent %s initialisé", self.name)
     
     @abstractmethod
     async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
@@ -70,6 +111,12 @@ class BaseAgent(ABC):
         """
         pass
     
+    def execute_task_sync(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Variante synchrone de execute_task, utilisée par start_task quand IS_ASYNC est False
+        """
+        raise NotImplementedError(f"{type(self).__name__} ne fournit pas d'exécution synchrone")
+    
     @abstractmethod
     def can_handle_task(self, task: Dict[str, Any]) -> bool:
         """
@@ -96,11 +143,26 @@ class BaseAgent(ABC):
         """
         pass
     
+    async def estimate_task_cost_async(self, task: Dict[str, Any]) -> float:
+        """
+        Variante asynchrone de estimate_task_cost, attendue en parallèle par le coordinateur
+        À redéfinir par les agents dont l'estimation fait des E/S (comptage de tokens distant...)
+        """
+        return self.estimate_task_cost(task)
+    
     def get_model_config(self) -> Dict[str, Any]:
-        """Retourne la configuration optimale de modèle pour cet agent"""
+        """
+        Retourne la configuration optimale de modèle pour cet agent
+        Le dict retourné est mis en cache et partagé : le copier avant de le modifier
+        """
+        # Import local : le resource_manager lance la détection système à l'import
         from ..core.resource_manager import resource_manager
         
-        base_config = resource_manager.get_optimal_model_config()
+        if self._model_config_version == resource_manager.config_version:
+            return self._model_config_cache
+        
+        # Copie : la table du resource_manager n'est pas modifiée
+        base_config = dict(resource_manager.get_optimal_model_config())
         
         # Personnalisation selon le type d'agent
         if hasattr(self, 'specialized_model'):
@@ -110,7 +172,9 @@ class BaseAgent(ABC):
                 base_config['selected_model'] = base_config.get('primary_model', 'mistral:7b')
         else:
             base_config['selected_model'] = base_config.get('primary_model', 'mistral:7b')
-            
+        
+        self._model_config_cache = base_config
+        self._model_config_version = resource_manager.config_version
         return base_config
     
     async def start_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
@@ -118,7 +182,9 @@ class BaseAgent(ABC):
         Point d'entrée principal pour exécuter une tâche
         Gère les métriques, logging et gestion d'erreurs
         """
+        # Une seule lecture de l'horloge murale ; les durées viennent de l'horloge monotone
         task_start_time = time.time()
+        start = time.monotonic()
         self.current_task = task
         self.status = AgentStatus.WORKING
         self.last_activity = task_start_time
@@ -137,35 +203,39 @@ class BaseAgent(ABC):
         
         # Estimation du coût
         estimated_cost = self.estimate_task_cost(task)
-        self.logger.info(f"Début tâche {task.get('id', 'unknown')} - Coût estimé: {estimated_cost:.4f}€")
+        # Formatage différé (%-style) : aucune chaîne construite si INFO est désactivé
+        # (isEnabledFor est évalué à l'appel pour suivre une configuration tardive du logging)
+        log_info = self.logger.isEnabledFor(logging.INFO)
+        if log_info:
+            self.logger.info("Début tâche %s - Coût estimé: %.4f€", task.get('id', 'unknown'), estimated_cost)
         
+        duration = 0.0
         try:
             # Exécution de la tâche
-            result = await self.execute_task(task)
+            result = await self.execute_task(task) if self.IS_ASYNC else self.execute_task_sync(task)
             
             # Mise à jour des métriques
-            duration = time.time() - task_start_time
+            duration = time.monotonic() - start
             actual_cost = result.get('cost', estimated_cost)
             
-            self._update_metrics(True, duration, actual_cost)
+            self._update_metrics(True, duration, actual_cost, task_start_time + duration)
             self.status = AgentStatus.COMPLETED
             
-            # Enrichissement du résultat
-            result.update({
-                'agent': self.name,
-                'duration': duration,
-                'estimated_cost': estimated_cost,
-                'actual_cost': actual_cost,
-                'timestamp': task_start_time
-            })
+            # Enrichissement du résultat (affectations directes, sans dict intermédiaire)
+            result['agent'] = self.name
+            result['duration'] = duration
+            result['estimated_cost'] = estimated_cost
+            result['actual_cost'] = actual_cost
+            result['timestamp'] = task_start_time
             
-            self.logger.info(f"Tâche terminée avec succès en {duration:.2f}s - Coût: {actual_cost:.4f}€")
+            if log_info:
+                self.logger.info("Tâche terminée avec succès en %.2fs - Coût: %.4f€", duration, actual_cost)
             return result
             
         except Exception as e:
             # Gestion d'erreur
-            duration = time.time() - task_start_time
-            self._update_metrics(False, duration, 0.0)
+            duration = time.monotonic() - start
+            self._update_metrics(False, duration, 0.0, task_start_time + duration)
             self.status = AgentStatus.ERROR
             
             error_msg = f"Erreur lors de l'exécution: {str(e)}"
@@ -182,10 +252,11 @@ class BaseAgent(ABC):
             }
         finally:
             self.current_task = None
-            self.last_activity = time.time()
+            self.last_activity = task_start_time + duration
     
-    def _update_metrics(self, success: bool, duration: float, cost: float):
-        """Met à jour les métriques de performance"""
+    def _update_metrics(self, success: bool, duration: float, cost: float,
+                        timestamp: Optional[float] = None):
+        """Met à jour les métriques de performance (timestamp : fin de tâche, horloge murale)"""
         self.total_tasks += 1
         self.total_cost_euros += cost
         
@@ -195,19 +266,20 @@ class BaseAgent(ABC):
             self.failed_tasks += 1
         
         # Enregistrement dans l'historique
-        task_record = {
-            'success': success,
-            'duration': duration,
-            'cost': cost,
-            'timestamp': time.time(),
-            'task_id': self.current_task.get('id', 'unknown') if self.current_task else 'unknown'
-        }
-        
-        self.task_history.append(task_record)
+        task_record = TaskRecord(
+            success,
+            duration,
+            cost,
+            time.time() if timestamp is None else timestamp,
+            self.current_task.get('id', 'unknown') if self.current_task else 'unknown'
+        )
         
-        # Limite l'historique à 100 entrées
-        if len(self.task_history) > 100:
-            self.task_history = self.task_history[-100:]
+        # L'entrée la plus ancienne sort de la somme avant d'être évincée par append
+        history = self.task_history
+        if len(history) == history.maxlen:
+            self._duration_sum -= history[0].duration
+        self._duration_sum += duration
+        history.append(task_record)
     
     def get_performance_summary(self) -> Dict[str, Any]:
         """Retourne un résumé des performances de l'agent"""
@@ -215,12 +287,12 @@ class BaseAgent(ABC):
         avg_duration = 0.0
         
         if self.task_history:
-            avg_duration = sum(t['duration'] for t in self.task_history) / len(self.task_history)
+            avg_duration = self._duration_sum / len(self.task_history)
         
         return {
             'name': self.name,
             'description': self.description,
-            'status': self.status.value,
+            'status': self.status.label,
             'total_tasks': self.total_tasks,
             'successful_tasks': self.successful_tasks,
             'failed_tasks': self.failed_tasks,
@@ -233,14 +305,15 @@ class BaseAgent(ABC):
     def reset_metrics(self):
         """Remet à zéro les métriques de performance"""
         self.task_history.clear()
+        self._duration_sum = 0.0
         self.total_tasks = 0
         self.successful_tasks = 0
         self.failed_tasks = 0
         self.total_cost_euros = 0.0
-        self.logger.info(f"Métriques de {self.name} remises à zéro")
+        self.logger.info("Métriques de %s remises à zéro", self.name)
     
     def __str__(self) -> str:
-        return f"Agent({self.name}, status={self.status.value}, tasks={self.total_tasks})"
+        return f"Agent({self.name}, status={self.status.label}, tasks={self.total_tasks})"
     
     def __repr__(self) -> str:
         return self.__str__()
@@ -3,96 +3,27 @@ EcoAgent Framework - Agent Codeur
 Génère le code source basé sur l'analyse et l'architecture
 """
 
+import asyncio
+import inspect
 import os
-from typing import Dict, Any, List
+from itertools import chain
+from string import Template
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Mapping, Tuple
 from .base_agent import BaseAgent
 
-class CoderAgent(BaseAgent):
-    """
-    Agent codeur qui génère le code source complet
-    """
-    
-    def __init__(self):
-        super().__init__(
-            name="coder",
-            description="Génère le code source complet basé sur l'analyse et l'architecture",
-            model_preference="local"
-        )
-        
-        # Utilise le modèle de code spécialisé si disponible
-        self.specialized_model = "coding_model"
-        
-        # Templates de code
-        self.code_templates = self._load_code_templates()
-    
-    async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
-        """
-        Génère le code source complet
-        """
-        description = task.get('description', '')
-        context = task.get('context', {})
-        
-        # Récupération des étapes précédentes
-        analysis_result = context.get('analysis', {})
-        architect_result = context.get('architect', {})
-        
-        project_type = analysis_result.get('project_type', 'general_application')
-        complexity = analysis_result.get('complexity', 'medium')
-        tech_stack = architect_result.get('technology_stack', {})
-        file_structure = architect_result.get('file_structure', {})
-        api_design = architect_result.get('api_design', {})
-        
-        self.logger.info(f"Génération du code pour {project_type} avec {tech_stack.get('backend', 'Python')}")
-        
-        # Génération du code
-        generated_files = {}
-        
-        if project_type in ['web_application', 'api']:
-            generated_files.update(await self._generate_fastapi_code(
-                tech_stack, api_design, analysis_result, architect_result
-            ))
-        elif project_type == 'script':
-            generated_files.update(await self._generate_script_code(
-                analysis_result, architect_result
-            ))
-        
-        # Génération des fichiers de configuration
-        config_files = await self._generate_config_files(architect_result)
-        generated_files.update(config_files)
-        
-        # Génération des tests
-        test_files = await self._generate_test_files(project_type, api_design)
-        generated_files.update(test_files)
-        
-        # Génération de la documentation
-        doc_files = await self._generate_documentation(analysis_result, architect_result)
-        generated_files.update(doc_files)
-        
-        result = {
-            'success': True,
-            'generated_files': generated_files,
-            'file_count': len(generated_files),
-            'main_technologies': list(tech_stack.values())[:3],
-            'entry_point': self._determine_entry_point(project_type),
-            'installation_commands': self._generate_installation_commands(architect_result),
-            'run_commands': self._generate_run_commands(project_type, tech_stack)
-        }
-        
-        return result
-    
-    async def _generate_fastapi_code(self, tech_stack: Dict, api_design: Dict, 
-                                   analysis: Dict, architect: Dict) -> Dict[str, str]:
-        """Génère une application FastAPI complète"""
-        
-        files = {}
-        
-        # main.py - Point d'entrée principal
-        files['main.py'] = '''"""
+# Gabarits de code : chaînes constantes construites une seule fois à l'import,
+# les _generate_* ne font plus qu'assembler des références partagées
+
+# --- Application FastAPI (web_application / api) ---
+
+_FASTAPI_MAIN_PY = '''"""
 Application FastAPI générée par EcoAgent Framework
 """
 
 from fastapi import FastAPI, Depends, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.security import HTTPBearer
 import uvicorn
 
@@ -109,7 +40,9 @@ app = FastAPI(
     description="API REST générée automatiquement",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    # Sérialisation JSON par orjson (natif) plutôt que le json de la stdlib
+    default_response_class=ORJSONResponse
 )
 
 # Configuration CORS
@@ -143,8 +76,7 @@ if __name__ == "__main__":
     )
 '''
 
-        # app/config.py - Configuration
-        files['app/config.py'] = '''"""
+_FASTAPI_CONFIG_PY = '''"""
 Configuration de l'application
 """
 
@@ -170,8 +102,7 @@ class Settings(BaseSettings):
 settings = Settings()
 '''
 
-        # app/database.py - Configuration base de données
-        files['app/database.py'] = '''"""
+_FASTAPI_DATABASE_PY = '''"""
 Configuration de la base de données
 """
 
@@ -180,10 +111,15 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
 
-# Moteur de base de données
+# Moteur de base de données : pool dimensionné pour la concurrence,
+# connexions vérifiées avant usage et recyclées toutes les heures
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG
+    echo=settings.DEBUG,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    pool_recycle=3600
 )
 
 # Session de base de données
@@ -201,8 +137,7 @@ def get_db():
         db.close()
 '''
 
-        # app/models/user.py - Modèle utilisateur
-        files['app/models/user.py'] = '''"""
+_FASTAPI_MODELS_USER_PY = '''"""
 Modèle utilisateur
 """
 
@@ -222,8 +157,7 @@ class User(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 '''
 
-        # app/models/item.py - Modèle item
-        files['app/models/item.py'] = '''"""
+_FASTAPI_MODELS_ITEM_PY = '''"""
 Modèle item générique
 """
 
@@ -247,8 +181,7 @@ class Item(Base):
     owner = relationship("User", back_populates="items")
 '''
 
-        # Ajout de la relation dans User
-        files['app/models/__init__.py'] = '''"""
+_FASTAPI_MODELS_INIT_PY = '''"""
 Modèles de données
 """
 
@@ -264,8 +197,7 @@ User.items = relationship("Item", back_populates="owner")
 __all__ = ["User", "Item"]
 '''
 
-        # app/schemas/user.py - Schémas Pydantic
-        files['app/schemas/user.py'] = '''"""
+_FASTAPI_SCHEMAS_USER_PY = '''"""
 Schémas Pydantic pour les utilisateurs
 """
 
@@ -298,8 +230,7 @@ class UserLogin(BaseModel):
     password: str
 '''
 
-        # app/routers/users.py - Routes utilisateurs
-        files['app/routers/users.py'] = '''"""
+_FASTAPI_ROUTERS_USERS_PY = '''"""
 Routes pour la gestion des utilisateurs
 """
 
@@ -374,12 +305,12 @@ async def delete_user(user_id: int, db: Session = Depends(get_db)):
         )
 '''
 
-        # app/routers/items.py - Routes items
-        files['app/routers/items.py'] = '''"""
+_FASTAPI_ROUTERS_ITEMS_PY = '''"""
 Routes pour la gestion des items
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List
 
@@ -396,7 +327,7 @@ async def get_items(
     db: Session = Depends(get_db)
 ):
     """Récupère la liste des items"""
-    items = db.query(Item).offset(skip).limit(limit).all()
+    items = db.execute(select(Item).offset(skip).limit(limit)).scalars().all()
     return items
 
 @router.post("/items", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
@@ -409,8 +340,7 @@ async def create_item(item: ItemCreate, db: Session = Depends(get_db)):
     return db_item
 '''
 
-        # app/schemas/item.py - Schémas pour items
-        files['app/schemas/item.py'] = '''"""
+_FASTAPI_SCHEMAS_ITEM_PY = '''"""
 Schémas Pydantic pour les items
 """
 
@@ -440,8 +370,7 @@ class ItemResponse(ItemBase):
         from_attributes = True
 '''
 
-        # app/routers/health.py - Health check
-        files['app/routers/health.py'] = '''"""
+_FASTAPI_ROUTERS_HEALTH_PY = '''"""
 Routes pour le health check
 """
 
@@ -471,45 +400,48 @@ async def health_check(db: Session = Depends(get_db)):
     }
 '''
 
-        # app/services/user_service.py - Service utilisateur
-        files['app/services/user_service.py'] = '''"""
+_FASTAPI_SERVICES_USER_SERVICE_PY = '''"""
 Service pour la gestion des utilisateurs
 """
 
+from sqlalchemy import delete, select, update
 from sqlalchemy.orm import Session
-from passlib.context import CryptContext
+import bcrypt
 from ..models.user import User
 from ..schemas.user import UserCreate, UserUpdate
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt ne prend en compte que les 72 premiers octets du mot de passe
+BCRYPT_MAX_BYTES = 72
 
 class UserService:
     """Service pour les opérations utilisateur"""
     
     @staticmethod
     def get_password_hash(password: str) -> str:
-        """Hash le mot de passe"""
-        return pwd_context.hash(password)
+        """Hash le mot de passe (appel direct à bcrypt, 12 tours)"""
+        secret = password.encode("utf-8")[:BCRYPT_MAX_BYTES]
+        return bcrypt.hashpw(secret, bcrypt.gensalt(rounds=12)).decode("ascii")
     
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Vérifie le mot de passe"""
-        return pwd_context.verify(plain_password, hashed_password)
+        secret = plain_password.encode("utf-8")[:BCRYPT_MAX_BYTES]
+        return bcrypt.checkpw(secret, hashed_password.encode("ascii"))
     
     @staticmethod
     def get_user(db: Session, user_id: int):
-        """Récupère un utilisateur par ID"""
-        return db.query(User).filter(User.id == user_id).first()
+        """Récupère un utilisateur par ID (carte d'identité de la session consultée d'abord)"""
+        return db.get(User, user_id)
     
     @staticmethod
     def get_user_by_email(db: Session, email: str):
         """Récupère un utilisateur par email"""
-        return db.query(User).filter(User.email == email).first()
+        return db.execute(select(User).where(User.email == email)).scalars().first()
     
     @staticmethod
     def get_users(db: Session, skip: int = 0, limit: int = 100):
         """Récupère la liste des utilisateurs"""
-        return db.query(User).offset(skip).limit(limit).all()
+        return db.execute(select(User).offset(skip).limit(limit)).scalars().all()
     
     @staticmethod
     def create_user(db: Session, user: UserCreate):
@@ -527,165 +459,517 @@ class UserService:
     
     @staticmethod
     def update_user(db: Session, user_id: int, user_update: UserUpdate):
-        """Met à jour un utilisateur"""
-        db_user = db.query(User).filter(User.id == user_id).first()
-        if not db_user:
-            return None
-        
+        """Met à jour un utilisateur (un seul UPDATE, sans chargement préalable)"""
         update_data = user_update.dict(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(db_user, field, value)
+        if not update_data:
+            return UserService.get_user(db, user_id)
         
+        result = db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
-        db.refresh(db_user)
-        return db_user
+        return UserService.get_user(db, user_id) if result.rowcount else None
     
     @staticmethod
     def delete_user(db: Session, user_id: int) -> bool:
-        """Supprime un utilisateur"""
-        db_user = db.query(User).filter(User.id == user_id).first()
-        if not db_user:
-            return False
-        
-        db.delete(db_user)
+        """Supprime un utilisateur (un seul DELETE, sans chargement préalable)"""
+        result = db.execute(
+            delete(User)
+            .where(User.id == user_id)
+            .execution_options(synchronize_session=False)
+        )
         db.commit()
-        return True
+        return result.rowcount > 0
 '''
 
-        return files
-    
-    async def _generate_script_code(self, analysis: Dict, architect: Dict) -> Dict[str, str]:
-        """Génère un script Python simple"""
-        
-        files = {}
-        
-        # main.py pour script
-        files['main.py'] = '''#!/usr/bin/env python3
-"""
-Script généré par EcoAgent Framework
+_FASTAPI_FILES: Mapping[str, str] = MappingProxyType({
+    'main.py': _FASTAPI_MAIN_PY,
+    'app/config.py': _FASTAPI_CONFIG_PY,
+    'app/database.py': _FASTAPI_DATABASE_PY,
+    'app/models/user.py': _FASTAPI_MODELS_USER_PY,
+    'app/models/item.py': _FASTAPI_MODELS_ITEM_PY,
+    'app/models/__init__.py': _FASTAPI_MODELS_INIT_PY,
+    'app/schemas/user.py': _FASTAPI_SCHEMAS_USER_PY,
+    'app/routers/users.py': _FASTAPI_ROUTERS_USERS_PY,
+    'app/routers/items.py': _FASTAPI_ROUTERS_ITEMS_PY,
+    'app/schemas/item.py': _FASTAPI_SCHEMAS_ITEM_PY,
+    'app/routers/health.py': _FASTAPI_ROUTERS_HEALTH_PY,
+    'app/services/user_service.py': _FASTAPI_SERVICES_USER_SERVICE_PY
+})
+
+# --- Application FastAPI, couche base de données asynchrone ---
+# Variante retenue par CoderAgent._use_async_db : SQLAlchemy asyncio, sessions
+# AsyncSession et requêtes select() attendues dans les routes
+
+_FASTAPI_ASYNC_MAIN_PY = '''"""
+Application FastAPI générée par EcoAgent Framework
 """
 
-import argparse
-import logging
-from pathlib import Path
-from src.utils import setup_logging, load_config
-from src.processor import DataProcessor
+from contextlib import asynccontextmanager
 
-def main():
-    """Fonction principale du script"""
-    parser = argparse.ArgumentParser(description="Script généré par EcoAgent")
-    parser.add_argument("input", help="Fichier d'entrée")
-    parser.add_argument("output", help="Fichier de sortie")
-    parser.add_argument("--config", default="config/config.yaml", help="Fichier de configuration")
-    parser.add_argument("--verbose", "-v", action="store_true", help="Mode verbeux")
-    
-    args = parser.parse_args()
-    
-    # Configuration du logging
-    setup_logging(verbose=args.verbose)
-    logger = logging.getLogger(__name__)
-    
-    try:
-        # Chargement de la configuration
-        config = load_config(args.config)
-        
-        # Traitement
-        processor = DataProcessor(config)
-        processor.process(args.input, args.output)
-        
-        logger.info(f"Traitement terminé: {args.input} -> {args.output}")
-        
-    except Exception as e:
-        logger.error(f"Erreur lors du traitement: {e}")
-        return 1
-    
-    return 0
+from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from fastapi.security import HTTPBearer
+import uvicorn
+
+from app.database import engine, Base
+from app.routers import items, users, health
+from app.config import settings
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Création des tables au démarrage (le moteur asynchrone passe par run_sync)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    await engine.dispose()
+
+# Instance FastAPI
+app = FastAPI(
+    title="Application générée par EcoAgent",
+    description="API REST générée automatiquement",
+    version="1.0.0",
+    docs_url="/docs",
+    redoc_url="/redoc",
+    lifespan=lifespan,
+    # Sérialisation JSON par orjson (natif) plutôt que le json de la stdlib
+    default_response_class=ORJSONResponse
+)
+
+# Configuration CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],  # À restreindre en production
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Inclusion des routers
+app.include_router(health.router, prefix="/api/v1", tags=["health"])
+app.include_router(items.router, prefix="/api/v1", tags=["items"])
+app.include_router(users.router, prefix="/api/v1", tags=["users"])
+
+@app.get("/")
+async def root():
+    return {
+        "message": "Application générée par EcoAgent Framework",
+        "docs": "/docs",
+        "health": "/api/v1/health"
+    }
 
 if __name__ == "__main__":
-    exit(main())
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True
+    )
 '''
 
-        # src/utils.py
-        files['src/utils.py'] = '''"""
-Utilitaires pour le script
+_FASTAPI_ASYNC_DATABASE_PY = '''"""
+Configuration de la base de données (SQLAlchemy asynchrone)
 """
 
-import logging
-import yaml
-import json
-from pathlib import Path
-from typing import Dict, Any
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.declarative import declarative_base
+from .config import settings
 
-def setup_logging(verbose: bool = False):
-    """Configure le logging"""
-    level = logging.DEBUG if verbose else logging.INFO
-    logging.basicConfig(
-        level=level,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+def _async_url(url: str) -> str:
+    """Sélectionne le pilote asynchrone asyncpg pour les URL PostgreSQL"""
+    if url.startswith("postgresql://"):
+        return "postgresql+asyncpg://" + url[len("postgresql://"):]
+    return url
+
+# Moteur de base de données : pool dimensionné pour la concurrence,
+# connexions vérifiées avant usage et recyclées toutes les heures
+engine = create_async_engine(
+    _async_url(settings.DATABASE_URL),
+    echo=settings.DEBUG,
+    pool_size=20,
+    max_overflow=40,
+    pool_pre_ping=True,
+    pool_recycle=3600
+)
 
-def load_config(config_path: str) -> Dict[str, Any]:
-    """Charge la configuration depuis un fichier"""
-    config_file = Path(config_path)
-    
-    if not config_file.exists():
-        return {}
-    
-    if config_file.suffix.lower() == '.yaml' or config_file.suffix.lower() == '.yml':
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    elif config_file.suffix.lower() == '.json':
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    else:
-        raise ValueError(f"Format de configuration non supporté: {config_file.suffix}")
+# Session de base de données (pas d'expiration au commit : aucun rechargement implicite)
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+# Classe de base pour les modèles
+Base = declarative_base()
+
+# Dépendance pour obtenir la session de base de données
+async def get_db():
+    async with SessionLocal() as db:
+        yield db
 '''
 
-        # src/processor.py
-        files['src/processor.py'] = '''"""
-Processeur principal du script
+_FASTAPI_ASYNC_ROUTERS_USERS_PY = '''"""
+Routes pour la gestion des utilisateurs
 """
 
-import json
-import csv
-from pathlib import Path
-from typing import Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
 
-class DataProcessor:
-    """Processeur de données générique"""
-    
-    def __init__(self, config: Dict[str, Any]):
-        self.config = config
+from ..database import get_db
+from ..schemas.user import UserCreate, UserResponse, UserUpdate
+from ..services.user_service import UserService
+
+router = APIRouter()
+
+@router.get("/users", response_model=List[UserResponse])
+async def get_users(
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db)
+):
+    """Récupère la liste des utilisateurs"""
+    users = await UserService.get_users(db, skip=skip, limit=limit)
+    return users
+
+@router.get("/users/{user_id}", response_model=UserResponse)
+async def get_user(user_id: int, db: AsyncSession = Depends(get_db)):
+    """Récupère un utilisateur par son ID"""
+    user = await UserService.get_user(db, user_id=user_id)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Utilisateur non trouvé"
+        )
+    return user
+
+@router.post("/users", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
+    """Crée un nouvel utilisateur"""
+    # Vérification si l'utilisateur existe déjà
+    existing_user = await UserService.get_user_by_email(db, email=user.email)
+    if existing_user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Un utilisateur avec cet email existe déjà"
+        )
     
-    def process(self, input_path: str, output_path: str):
-        """Traite les données d'entrée et génère la sortie"""
-        input_file = Path(input_path)
-        output_file = Path(output_path)
-        
-        # Détection du format d'entrée
-        if input_file.suffix.lower() == '.csv':
-            data = self._read_csv(input_file)
-        elif input_file.suffix.lower() == '.json':
-            data = self._read_json(input_file)
-        else:
-            raise ValueError(f"Format non supporté: {input_file.suffix}")
-        
-        # Traitement des données
-        processed_data = self._process_data(data)
-        
-        # Écriture du résultat
-        if output_file.suffix.lower() == '.json':
-            self._write_json(processed_data, output_file)
-        elif output_file.suffix.lower() == '.csv':
-            self._write_csv(processed_data, output_file)
-        else:
+    return await UserService.create_user(db=db, user=user)
+
+@router.put("/users/{user_id}", response_model=UserResponse)
+async def update_user(
+    user_id: int,
+    user_update: UserUpdate,
+    db: AsyncSession = Depends(get_db)
+):
+    """Met à jour un utilisateur"""
+    user = await UserService.update_user(db, user_id=user_id, user_update=user_update)
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Utilisateur non trouvé"
+        )
+    return user
+
+@router.delete("/users/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_user(user_id: int, db: AsyncSession = Depends(get_db)):
+    """Supprime un utilisateur"""
+    success = await UserService.delete_user(db, user_id=user_id)
+    if not success:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Utilisateur non trouvé"
+        )
+'''
+
+_FASTAPI_ASYNC_ROUTERS_ITEMS_PY = '''"""
+Routes pour la gestion des items
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List
+
+from ..database import get_db
+from ..models.item import Item
+from ..schemas.item import ItemCreate, ItemResponse, ItemUpdate
+
+router = APIRouter()
+
+@router.get("/items", response_model=List[ItemResponse])
+async def get_items(
+    skip: int = 0,
+    limit: int = 100,
+    db: AsyncSession = Depends(get_db)
+):
+    """Récupère la liste des items"""
+    result = await db.execute(select(Item).offset(skip).limit(limit))
+    return result.scalars().all()
+
+@router.post("/items", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
+async def create_item(item: ItemCreate, db: AsyncSession = Depends(get_db)):
+    """Crée un nouvel item"""
+    db_item = Item(**item.dict())
+    db.add(db_item)
+    await db.commit()
+    await db.refresh(db_item)
+    return db_item
+'''
+
+_FASTAPI_ASYNC_ROUTERS_HEALTH_PY = '''"""
+Routes pour le health check
+"""
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_db
+import datetime
+
+router = APIRouter()
+
+@router.get("/health")
+async def health_check(db: AsyncSession = Depends(get_db)):
+    """Vérifie l'état de santé de l'application"""
+    try:
+        # Test de connexion à la base de données
+        await db.execute(text("SELECT 1"))
+        db_status = "healthy"
+    except Exception as e:
+        db_status = f"unhealthy: {str(e)}"
+    
+    return {
+        "status": "healthy" if db_status == "healthy" else "unhealthy",
+        "timestamp": datetime.datetime.now().isoformat(),
+        "database": db_status,
+        "version": "1.0.0"
+    }
+'''
+
+_FASTAPI_ASYNC_SERVICES_USER_SERVICE_PY = '''"""
+Service pour la gestion des utilisateurs (SQLAlchemy asynchrone)
+"""
+
+from sqlalchemy import delete, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+import bcrypt
+from ..models.user import User
+from ..schemas.user import UserCreate, UserUpdate
+
+# bcrypt ne prend en compte que les 72 premiers octets du mot de passe
+BCRYPT_MAX_BYTES = 72
+
+class UserService:
+    """Service pour les opérations utilisateur"""
+    
+    @staticmethod
+    def get_password_hash(password: str) -> str:
+        """Hash le mot de passe (appel direct à bcrypt, 12 tours)"""
+        secret = password.encode("utf-8")[:BCRYPT_MAX_BYTES]
+        return bcrypt.hashpw(secret, bcrypt.gensalt(rounds=12)).decode("ascii")
+    
+    @staticmethod
+    def verify_password(plain_password: str, hashed_password: str) -> bool:
+        """Vérifie le mot de passe"""
+        secret = plain_password.encode("utf-8")[:BCRYPT_MAX_BYTES]
+        return bcrypt.checkpw(secret, hashed_password.encode("ascii"))
+    
+    @staticmethod
+    async def get_user(db: AsyncSession, user_id: int):
+        """Récupère un utilisateur par ID"""
+        return await db.get(User, user_id)
+    
+    @staticmethod
+    async def get_user_by_email(db: AsyncSession, email: str):
+        """Récupère un utilisateur par email"""
+        result = await db.execute(select(User).where(User.email == email))
+        return result.scalars().first()
+    
+    @staticmethod
+    async def get_users(db: AsyncSession, skip: int = 0, limit: int = 100):
+        """Récupère la liste des utilisateurs"""
+        result = await db.execute(select(User).offset(skip).limit(limit))
+        return result.scalars().all()
+    
+    @staticmethod
+    async def create_user(db: AsyncSession, user: UserCreate):
+        """Crée un nouvel utilisateur"""
+        hashed_password = UserService.get_password_hash(user.password)
+        db_user = User(
+            email=user.email,
+            username=user.username,
+            hashed_password=hashed_password
+        )
+        db.add(db_user)
+        await db.commit()
+        await db.refresh(db_user)
+        return db_user
+    
+    @staticmethod
+    async def update_user(db: AsyncSession, user_id: int, user_update: UserUpdate):
+        """Met à jour un utilisateur (un seul UPDATE ... RETURNING)"""
+        update_data = user_update.dict(exclude_unset=True)
+        if not update_data:
+            return await UserService.get_user(db, user_id)
+        
+        result = await db.execute(
+            update(User)
+            .where(User.id == user_id)
+            .values(**update_data)
+            .returning(User)
+        )
+        db_user = result.scalars().first()
+        await db.commit()
+        return db_user
+    
+    @staticmethod
+    async def delete_user(db: AsyncSession, user_id: int) -> bool:
+        """Supprime un utilisateur (un seul DELETE)"""
+        result = await db.execute(delete(User).where(User.id == user_id))
+        await db.commit()
+        return result.rowcount > 0
+'''
+
+_FASTAPI_ASYNC_FILES: Mapping[str, str] = MappingProxyType({
+    **_FASTAPI_FILES,
+    'main.py': _FASTAPI_ASYNC_MAIN_PY,
+    'app/database.py': _FASTAPI_ASYNC_DATABASE_PY,
+    'app/routers/users.py': _FASTAPI_ASYNC_ROUTERS_USERS_PY,
+    'app/routers/items.py': _FASTAPI_ASYNC_ROUTERS_ITEMS_PY,
+    'app/routers/health.py': _FASTAPI_ASYNC_ROUTERS_HEALTH_PY,
+    'app/services/user_service.py': _FASTAPI_ASYNC_SERVICES_USER_SERVICE_PY
+})
+
+# --- Script Python ---
+
+_SCRIPT_MAIN_PY = '''#!/usr/bin/env python3
+"""
+Script généré par EcoAgent Framework
+"""
+
+import argparse
+import logging
+from pathlib import Path
+from src.utils import setup_logging, load_config
+from src.processor import DataProcessor
+
+def main():
+    """Fonction principale du script"""
+    parser = argparse.ArgumentParser(description="Script généré par EcoAgent")
+    parser.add_argument("input", help="Fichier d'entrée")
+    parser.add_argument("output", help="Fichier de sortie")
+    parser.add_argument("--config", default="config/config.yaml", help="Fichier de configuration")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Mode verbeux")
+    
+    args = parser.parse_args()
+    
+    # Configuration du logging
+    setup_logging(verbose=args.verbose)
+    logger = logging.getLogger(__name__)
+    
+    try:
+        # Chargement de la configuration
+        config = load_config(args.config)
+        
+        # Traitement
+        processor = DataProcessor(config)
+        processor.process(args.input, args.output)
+        
+        logger.info("Traitement terminé: %s -> %s", args.input, args.output)
+        
+    except Exception as e:
+        logger.error("Erreur lors du traitement: %s", e)
+        return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
+'''
+
+_SCRIPT_UTILS_PY = '''"""
+Utilitaires pour le script
+"""
+
+import logging
+import yaml
+import json
+from pathlib import Path
+from typing import Dict, Any
+
+def setup_logging(verbose: bool = False):
+    """Configure le logging"""
+    level = logging.DEBUG if verbose else logging.INFO
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+def load_config(config_path: str) -> Dict[str, Any]:
+    """Charge la configuration depuis un fichier"""
+    config_file = Path(config_path)
+    
+    if not config_file.exists():
+        return {}
+    
+    if config_file.suffix.lower() == '.yaml' or config_file.suffix.lower() == '.yml':
+        with open(config_file, 'r', encoding='utf-8') as f:
+            return yaml.safe_load(f)
+    elif config_file.suffix.lower() == '.json':
+        with open(config_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    else:
+        raise ValueError(f"Format de configuration non supporté: {config_file.suffix}")
+'''
+
+_SCRIPT_PROCESSOR_PY = '''"""
+Processeur principal du script
+Les données CSV passent par Apache Arrow : lecture, renommage des colonnes et
+écriture sont exécutés en C++, sans boucle Python par ligne
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Dict, Any
+
+import pyarrow as pa
+import pyarrow.csv as pv
+
+class DataProcessor:
+    """Processeur de données générique"""
+    
+    def __init__(self, config: Dict[str, Any]):
+        self.config = config
+    
+    def process(self, input_path: str, output_path: str):
+        """Traite les données d'entrée et génère la sortie"""
+        input_file = Path(input_path)
+        output_file = Path(output_path)
+        
+        # Détection du format d'entrée
+        if input_file.suffix.lower() == '.csv':
+            data = self._read_csv(input_file)
+        elif input_file.suffix.lower() == '.json':
+            data = self._read_json(input_file)
+        else:
+            raise ValueError(f"Format non supporté: {input_file.suffix}")
+        
+        # Traitement des données
+        processed_data = self._process_data(data)
+        
+        # Écriture du résultat
+        if output_file.suffix.lower() == '.json':
+            self._write_json(processed_data, output_file)
+        elif output_file.suffix.lower() == '.csv':
+            self._write_csv(processed_data, output_file)
+        else:
             raise ValueError(f"Format de sortie non supporté: {output_file.suffix}")
     
-    def _read_csv(self, file_path: Path) -> list:
-        """Lit un fichier CSV"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            return list(reader)
+    def _read_csv(self, file_path: Path) -> pa.Table:
+        """Lit un fichier CSV (lecteur Arrow multithreadé, types des colonnes inférés)"""
+        return pv.read_csv(file_path)
     
     def _read_json(self, file_path: Path) -> Any:
         """Lit un fichier JSON"""
@@ -694,7 +978,9 @@ class DataProcessor:
     
     def _process_data(self, data: Any) -> Any:
         """Traite les données selon la configuration"""
-        # Logique de traitement basique
+        # Table Arrow : seuls les noms de colonnes changent, les données ne sont pas copiées
+        if isinstance(data, pa.Table):
+            return data.rename_columns([name.lower() for name in data.column_names])
         if isinstance(data, list):
             return [self._process_item(item) for item in data]
         else:
@@ -704,65 +990,176 @@ class DataProcessor:
         """Traite un élément individuel"""
         # Exemple de traitement
         if isinstance(item, dict):
-            processed = {}
-            for key, value in item.items():
-                processed[key.lower()] = value
-            return processed
+            return {key.lower(): value for key, value in item.items()}
         return item
     
     def _write_json(self, data: Any, file_path: Path):
         """Écrit les données en JSON"""
+        if isinstance(data, pa.Table):
+            data = data.to_pylist()
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+            # default=str : dates et décimaux inférés par Arrow
+            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
     
-    def _write_csv(self, data: list, file_path: Path):
+    def _write_csv(self, data: Any, file_path: Path):
         """Écrit les données en CSV"""
-        if not data:
-            return
+        if isinstance(data, list):
+            if not data:
+                return
+            if not isinstance(data[0], dict):
+                with open(file_path, 'w', newline='', encoding='utf-8') as f:
+                    csv.writer(f).writerows(data)
+                return
+            data = pa.Table.from_pylist(data)
         
-        with open(file_path, 'w', newline='', encoding='utf-8') as f:
-            if isinstance(data[0], dict):
-                writer = csv.DictWriter(f, fieldnames=data[0].keys())
-                writer.writeheader()
-                writer.writerows(data)
-            else:
-                writer = csv.writer(f)
-                writer.writerows(data)
+        pv.write_csv(data, file_path)
 '''
 
-        return files
+_SCRIPT_FILES: Mapping[str, str] = MappingProxyType({
+    'main.py': _SCRIPT_MAIN_PY,
+    'src/utils.py': _SCRIPT_UTILS_PY,
+    'src/processor.py': _SCRIPT_PROCESSOR_PY
+})
+
+# Variante « nombreux fichiers » (io_concurrency == 'many') : E/S asynchrones
+# parallèles ; pour un fichier unique, open() synchrone reste plus rapide
+_SCRIPT_MAIN_MANY_PY = '''#!/usr/bin/env python3
+"""
+Script généré par EcoAgent Framework
+Traite un lot de fichiers en parallèle (E/S asynchrones)
+"""
+
+import argparse
+import asyncio
+import logging
+from src.utils import setup_logging, load_config
+from src.batch import BatchProcessor
+
+def main():
+    """Fonction principale du script"""
+    parser = argparse.ArgumentParser(description="Script généré par EcoAgent")
+    parser.add_argument("inputs", nargs="+", help="Fichiers d'entrée (CSV ou JSON)")
+    parser.add_argument("--output-dir", "-o", default="output", help="Dossier des fichiers JSON produits")
+    parser.add_argument("--config", default="config/config.yaml", help="Fichier de configuration")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Mode verbeux")
     
-    async def _generate_config_files(self, architect_result: Dict) -> Dict[str, str]:
-        """Génère les fichiers de configuration"""
-        
-        files = {}
-        config_files = architect_result.get('configuration_files', {})
-        
-        # requirements.txt
-        dependencies = architect_result.get('dependencies', {})
-        requirements = []
-        for category, deps in dependencies.items():
-            if category != 'frontend':  # Ignore les dépendances frontend
-                requirements.extend(deps)
+    args = parser.parse_args()
+    
+    # Configuration du logging
+    setup_logging(verbose=args.verbose)
+    logger = logging.getLogger(__name__)
+    
+    try:
+        # Chargement de la configuration
+        config = load_config(args.config)
         
-        files['requirements.txt'] = '\n'.join(requirements) + '\n'
+        # Traitement concurrent de tous les fichiers
+        batch = BatchProcessor(config)
+        outputs = asyncio.run(batch.process_many(args.inputs, args.output_dir))
         
-        # .env.example
-        if '.env.example' in config_files:
-            files['.env.example'] = config_files['.env.example']
+        logger.info("Traitement terminé: %d fichiers -> %s", len(outputs), args.output_dir)
         
-        # docker-compose.yml
-        if 'docker-compose.yml' in config_files:
-            files['docker-compose.yml'] = config_files['docker-compose.yml']
+    except Exception as e:
+        logger.error("Erreur lors du traitement: %s", e)
+        return 1
+    
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
+'''
+
+_SCRIPT_BATCH_PY = '''"""
+Traitement concurrent de nombreux fichiers
+Lectures et écritures via aiofile, lancées ensemble avec asyncio.gather
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pyarrow as pa
+import pyarrow.csv as pv
+from aiofile import async_open
+
+from src.processor import DataProcessor
+
+class BatchProcessor:
+    """Applique DataProcessor à un lot de fichiers, une sortie JSON par fichier"""
+    
+    def __init__(self, config: Dict[str, Any], max_concurrency: int = 64):
+        self.processor = DataProcessor(config)
+        # Nombre maximal de fichiers ouverts simultanément
+        self.max_concurrency = max_concurrency
+    
+    async def process_many(self, input_paths: List[str], output_dir: str) -> List[Path]:
+        """Traite tous les fichiers d'entrée en parallèle"""
+        output = Path(output_dir)
+        output.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
         
-        # Dockerfile
-        files['Dockerfile'] = '''FROM python:3.11-slim
+        return await asyncio.gather(*(
+            self._process_one(Path(path), output, semaphore) for path in input_paths
+        ))
+    
+    async def _process_one(self, input_file: Path, output_dir: Path,
+                           semaphore: asyncio.Semaphore) -> Path:
+        """Lit, traite et écrit un fichier"""
+        async with semaphore:
+            async with async_open(input_file, 'rb') as afp:
+                raw = await afp.read()
+            
+            data = self.processor._process_data(self._parse(raw, input_file))
+            if isinstance(data, pa.Table):
+                data = data.to_pylist()
+            payload = json.dumps(data, indent=2, ensure_ascii=False, default=str)
+            
+            output_file = output_dir / f"{input_file.stem}.json"
+            async with async_open(output_file, 'wb') as afp:
+                await afp.write(payload.encode('utf-8'))
+            return output_file
+    
+    @staticmethod
+    def _parse(raw: bytes, input_file: Path) -> Any:
+        """Décode le contenu selon l'extension du fichier"""
+        suffix = input_file.suffix.lower()
+        if suffix == '.csv':
+            return pv.read_csv(pa.BufferReader(raw))
+        elif suffix == '.json':
+            return json.loads(raw)
+        raise ValueError(f"Format non supporté: {input_file.suffix}")
+'''
 
-WORKDIR /app
+_SCRIPT_MANY_FILES: Mapping[str, str] = MappingProxyType({
+    'main.py': _SCRIPT_MAIN_MANY_PY,
+    'src/utils.py': _SCRIPT_UTILS_PY,
+    'src/processor.py': _SCRIPT_PROCESSOR_PY,
+    'src/batch.py': _SCRIPT_BATCH_PY
+})
 
-# Copie des dépendances
+# --- Fichiers de configuration ---
+
+_DOCKERFILE = '''# syntax=docker/dockerfile:1.4
+
+# Étape de construction : dépendances installées dans un environnement virtuel
+FROM python:3.11-slim AS builder
+
+RUN python -m venv /opt/venv
+ENV PATH="/opt/venv/bin:$PATH"
+
+# Copie des dépendances seules : couche réutilisée tant que requirements.txt ne change pas
 COPY requirements.txt .
-RUN pip install --no-cache-dir -r requirements.txt
+# Cache pip BuildKit partagé entre les builds : les wheels ne sont ni retéléchargées ni recompilées
+RUN --mount=type=cache,target=/root/.cache/pip pip install -r requirements.txt
+
+# Image finale : environnement virtuel prêt à l'emploi, sans outils de construction
+FROM python:3.11-slim
+
+COPY --from=builder /opt/venv /opt/venv
+ENV PATH="/opt/venv/bin:$PATH"
+
+WORKDIR /app
 
 # Copie du code
 COPY . .
@@ -771,11 +1168,10 @@ COPY . .
 EXPOSE 8000
 
 # Commande par défaut
-CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000"]
+CMD ["uvicorn", "main:app", "--host", "0.0.0.0", "--port", "8000", "--loop", "uvloop", "--http", "httptools", "--workers", "4"]
 '''
 
-        # .gitignore
-        files['.gitignore'] = '''# Python
+_GITIGNORE = '''# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -816,33 +1212,100 @@ ENV/
 *.db
 *.sqlite3
 
-# Logs
-logs/
-*.log
+# Logs
+logs/
+*.log
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Testing
+.coverage
+.pytest_cache/
+htmlcov/
+
+# Docker
+.dockerignore
+'''
+
+# --- Documentation ---
+
+# README principal, compilé une fois ; les valeurs substituées ne sont pas réinterprétées
+_README_TEMPLATE = Template("""# $description
+
+Application $project_type générée automatiquement par EcoAgent Framework.
+
+## Démarrage rapide
+
+### Prérequis
+- Python 3.11+
+- Docker (optionnel)
+
+### Installation
+
+1. Clonez le repository
+2. Créez un environnement virtuel : python -m venv venv
+3. Activez l'environnement : source venv/bin/activate
+4. Installez les dépendances : pip install -r requirements.txt
+
+### Lancement
+
+Mode développement : python main.py
+
+## Documentation
+
+- Type : $project_type
+- Complexité : $complexity
+
+Structure du projet :
+- app/ : Code de l'application
+- tests/ : Tests automatisés
+- docs/ : Documentation
+
+## Tests
+
+Lancement des tests : pytest
+
+## Généré par EcoAgent Framework
+
+Type de projet : $project_type
+Complexité estimée : $complexity
+""")
+
+_API_DOC_MD = """# Documentation API
+
+## Endpoints disponibles
+
+### Health Check
+- GET /api/v1/health - Vérifie l'état de l'application
+
+### Utilisateurs
+- GET /api/v1/users - Liste des utilisateurs
+- POST /api/v1/users - Créer un utilisateur
+- GET /api/v1/users/{id} - Détails d'un utilisateur
+- PUT /api/v1/users/{id} - Modifier un utilisateur
+- DELETE /api/v1/users/{id} - Supprimer un utilisateur
+
+### Items
+- GET /api/v1/items - Liste des items
+- POST /api/v1/items - Créer un item
 
-# OS
-.DS_Store
-Thumbs.db
+## Authentification
+L'API utilise JWT pour l'authentification (si configuré).
 
-# Testing
-.coverage
-.pytest_cache/
-htmlcov/
+## Codes de réponse
+- 200 - Succès
+- 201 - Créé avec succès
+- 400 - Erreur de validation
+- 401 - Non autorisé
+- 404 - Non trouvé
+- 500 - Erreur serveur
+"""
 
-# Docker
-.dockerignore
-'''
+# --- Tests de l'application FastAPI ---
 
-        return files
-    
-    async def _generate_test_files(self, project_type: str, api_design: Dict) -> Dict[str, str]:
-        """Génère les fichiers de tests"""
-        
-        files = {}
-        
-        if project_type in ['web_application', 'api']:
-            # tests/test_main.py
-            files['tests/test_main.py'] = '''"""
+_TEST_MAIN_PY = '''"""
 Tests pour l'application principale
 """
 
@@ -870,8 +1333,7 @@ def test_docs_accessible():
     assert response.status_code == 200
 '''
 
-            # tests/test_users.py
-            files['tests/test_users.py'] = '''"""
+_TEST_USERS_PY = '''"""
 Tests pour les utilisateurs
 """
 
@@ -899,8 +1361,7 @@ def test_create_user():
     assert response.status_code in [201, 422]  # 422 si validation échoue
 '''
 
-            # tests/conftest.py
-            files['tests/conftest.py'] = '''"""
+_TEST_CONFTEST_PY = '''"""
 Configuration des tests
 """
 
@@ -948,8 +1409,64 @@ def client():
     app.dependency_overrides.clear()
 '''
 
-        elif project_type == 'script':
-            files['tests/test_processor.py'] = '''"""
+_FASTAPI_TEST_FILES: Mapping[str, str] = MappingProxyType({
+    'tests/test_main.py': _TEST_MAIN_PY,
+    'tests/test_users.py': _TEST_USERS_PY,
+    'tests/conftest.py': _TEST_CONFTEST_PY
+})
+
+_TEST_ASYNC_CONFTEST_PY = '''"""
+Configuration des tests (SQLAlchemy asynchrone)
+"""
+
+import asyncio
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from main import app
+from app.database import get_db, Base
+
+# Base de données de test SQLite (pilote asynchrone aiosqlite)
+SQLALCHEMY_DATABASE_URL = "sqlite+aiosqlite:///./test.db"
+
+# NullPool : aucune connexion partagée entre les boucles d'événements des tests
+engine = create_async_engine(SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+
+TestingSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+async def _create_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+async def _drop_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+
+@pytest.fixture
+def client():
+    """Fixture pour le client de test"""
+    asyncio.run(_create_tables())
+    
+    async def override_get_db():
+        async with TestingSessionLocal() as db:
+            yield db
+    
+    app.dependency_overrides[get_db] = override_get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    asyncio.run(_drop_tables())
+'''
+
+_FASTAPI_ASYNC_TEST_FILES: Mapping[str, str] = MappingProxyType({
+    **_FASTAPI_TEST_FILES,
+    'tests/conftest.py': _TEST_ASYNC_CONFTEST_PY
+})
+
+# --- Tests du script ---
+
+_TEST_PROCESSOR_PY = '''"""
 Tests pour le processeur de données
 """
 
@@ -1013,9 +1530,267 @@ def test_csv_to_json(processor):
         assert output_file.exists()
 '''
 
+_SCRIPT_TEST_FILES: Mapping[str, str] = MappingProxyType({
+    'tests/test_processor.py': _TEST_PROCESSOR_PY
+})
+
+
+# Commandes d'installation et de lancement : tuples partagés, retournés sans copie
+_INSTALL_COMMANDS: Tuple[str, ...] = (
+    'python -m venv venv',
+    'source venv/bin/activate',
+    'pip install -r requirements.txt'
+)
+_INSTALL_COMMANDS_WITH_DATABASE = _INSTALL_COMMANDS + ('# Configurez votre base de données dans .env',)
+
+_FASTAPI_RUN_COMMANDS: Tuple[str, ...] = (
+    'uvicorn main:app --reload',
+    # Production : boucle uvloop, parseur HTTP httptools, plusieurs workers
+    'uvicorn main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools --workers 4'
+)
+_SCRIPT_RUN_COMMANDS: Tuple[str, ...] = (
+    'python main.py --help',
+    'python main.py input.csv output.json'
+)
+_SCRIPT_MANY_RUN_COMMANDS: Tuple[str, ...] = (
+    'python main.py --help',
+    'python main.py data/*.csv --output-dir output'
+)
+_DEFAULT_RUN_COMMANDS: Tuple[str, ...] = ('python main.py',)
+
+# Taille du tampon d'écriture des fichiers générés (write_files)
+_WRITE_BUFFER_SIZE = 128 * 1024
+
+# Registre des gabarits par famille de projet (voir CoderAgent._load_code_templates)
+_CODE_TEMPLATES: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    'fastapi': _FASTAPI_FILES,
+    'fastapi_async': _FASTAPI_ASYNC_FILES,
+    'script': _SCRIPT_FILES,
+    'script_many': _SCRIPT_MANY_FILES,
+    'fastapi_tests': _FASTAPI_TEST_FILES,
+    'fastapi_async_tests': _FASTAPI_ASYNC_TEST_FILES,
+    'script_tests': _SCRIPT_TEST_FILES
+})
+
+class CoderAgent(BaseAgent):
+    """
+    Agent codeur qui génère le code source complet
+    """
+    
+    __slots__ = ('specialized_model', 'code_templates')
+    
+    # Génération purement CPU (assemblage de gabarits) : pas de coroutine par tâche
+    IS_ASYNC = False
+    
+    def __init__(self):
+        super().__init__(
+            name="coder",
+            description="Génère le code source complet basé sur l'analyse et l'architecture",
+            model_preference="local"
+        )
+        
+        # Utilise le modèle de code spécialisé si disponible
+        self.specialized_model = "coding_model"
+        
+        # Templates de code
+        self.code_templates = self._load_code_templates()
+    
+    async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Génère le code source complet
+        Les phases de génération sont indépendantes : si une sous-classe les rend
+        asynchrones (appel LLM, E/S), elles sont attendues en parallèle
+        """
+        analysis_result, architect_result = self._task_context(task)
+        phases = self._generate_phases(analysis_result, architect_result)
+        
+        pending = [i for i, files in enumerate(phases) if inspect.isawaitable(files)]
+        if pending:
+            done = await asyncio.gather(*(phases[i] for i in pending))
+            for i, files in zip(pending, done):
+                phases[i] = files
+        
+        return self._build_result(phases, analysis_result, architect_result)
+    
+    def execute_task_sync(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Version synchrone de execute_task (aucune attente d'E/S)"""
+        analysis_result, architect_result = self._task_context(task)
+        phases = self._generate_phases(analysis_result, architect_result)
+        return self._build_result(phases, analysis_result, architect_result)
+    
+    @staticmethod
+    def _task_context(task: Dict[str, Any]) -> Tuple[Dict, Dict]:
+        """Récupère les résultats des étapes précédentes (analyse, architecture)"""
+        context = task.get('context', {})
+        return context.get('analysis', {}), context.get('architect', {})
+    
+    def _generate_phases(self, analysis_result: Dict, architect_result: Dict) -> List[Any]:
+        """
+        Lance les phases de génération, dans l'ordre : code, configuration, tests, documentation
+        Chaque élément est un dict de fichiers, ou un awaitable si la sous-classe
+        redéfinit la phase en coroutine
+        """
+        project_type = analysis_result.get('project_type', 'general_application')
+        tech_stack = architect_result.get('technology_stack', {})
+        api_design = architect_result.get('api_design', {})
+        
+        self.logger.info("Génération du code pour %s avec %s", project_type, tech_stack.get('backend', 'Python'))
+        
+        async_db = (project_type in ('web_application', 'api')
+                    and self._use_async_db(tech_stack, analysis_result))
+        
+        # Génération du code
+        if project_type in ['web_application', 'api']:
+            code_files = self._generate_fastapi_code(
+                tech_stack, api_design, analysis_result, architect_result
+            )
+        elif project_type == 'script':
+            code_files = self._generate_script_code(
+                analysis_result, architect_result
+            )
+        else:
+            code_files = {}
+        
+        return [
+            code_files,
+            # Génération des fichiers de configuration
+            self._generate_config_files(
+                architect_result, self._extra_requirements(project_type, analysis_result, async_db)
+            ),
+            # Génération des tests
+            self._generate_test_files(project_type, api_design, async_db),
+            # Génération de la documentation
+            self._generate_documentation(analysis_result, architect_result)
+        ]
+    
+    @staticmethod
+    def _has_api(api_design: Dict) -> bool:
+        """
+        Indique si l'architecture expose une API
+        Un api_design absent (pas d'étape architecture) est considéré comme une API par défaut
+        """
+        if api_design.get('type') == 'none':
+            return False
+        return bool(api_design.get('endpoints', True))
+    
+    @staticmethod
+    def _use_async_db(tech_stack: Dict, analysis: Dict) -> bool:
+        """
+        Choisit la couche base de données asynchrone (SQLAlchemy asyncio) :
+        forte concurrence annoncée, ou PostgreSQL (pilote asyncpg)
+        """
+        if analysis.get('concurrency') == 'high':
+            return True
+        return str(tech_stack.get('database', '')).lower() == 'postgresql'
+    
+    @staticmethod
+    def _extra_requirements(project_type: str, analysis_result: Dict,
+                            async_db: bool = False) -> List[str]:
+        """Dépendances ajoutées par les variantes de gabarits, en plus de celles de l'architecte"""
+        extra = []
+        if project_type in ('web_application', 'api'):
+            extra.append('orjson')
+            # Serveur de production (voir _generate_run_commands) ; uvloop n'existe pas sous Windows
+            extra.append('uvloop; sys_platform != "win32"')
+            extra.append('httptools')
+            # Hachage des mots de passe du UserService généré
+            extra.append('bcrypt')
+            if async_db:
+                # Pilotes asynchrones : asyncpg (PostgreSQL), aiosqlite (base de test)
+                extra.extend(('sqlalchemy[asyncio]', 'asyncpg', 'aiosqlite'))
+        if project_type == 'script' and analysis_result.get('io_concurrency', 'single') == 'many':
+            extra.append('aiofile')
+        return extra
+    
+    def _build_result(self, phases: List[Dict[str, str]], analysis_result: Dict,
+                      architect_result: Dict) -> Dict[str, Any]:
+        """Fusionne les fichiers des phases et construit le résultat de la tâche"""
+        project_type = analysis_result.get('project_type', 'general_application')
+        tech_stack = architect_result.get('technology_stack', {})
+        
+        # Fusion en une seule construction de dict (pas de update successifs)
+        code_files, config_files, test_files, doc_files = phases
+        generated_files = {**code_files, **config_files, **test_files, **doc_files}
+        
+        result = {
+            'success': True,
+            'generated_files': generated_files,
+            'file_count': len(generated_files),
+            'main_technologies': list(tech_stack.values())[:3],
+            'entry_point': self._determine_entry_point(project_type),
+            'installation_commands': self._generate_installation_commands(architect_result),
+            'run_commands': self._generate_run_commands(
+                project_type, tech_stack, analysis_result.get('io_concurrency', 'single')
+            )
+        }
+        
+        return result
+    
+    def _generate_fastapi_code(self, tech_stack: Dict, api_design: Dict, 
+                                   analysis: Dict, architect: Dict) -> Dict[str, str]:
+        """Génère une application FastAPI complète"""
+        if self._use_async_db(tech_stack, analysis):
+            return dict(self.code_templates['fastapi_async'])
+        return dict(self.code_templates['fastapi'])
+    
+    def _generate_script_code(self, analysis: Dict, architect: Dict) -> Dict[str, str]:
+        """Génère un script Python simple"""
+        # E/S asynchrones uniquement quand de nombreux fichiers sont traités en parallèle
+        if analysis.get('io_concurrency', 'single') == 'many':
+            return dict(self.code_templates['script_many'])
+        return dict(self.code_templates['script'])
+    
+    def _generate_config_files(self, architect_result: Dict,
+                               extra_requirements: Iterable[str] = ()) -> Dict[str, str]:
+        """
+        Génère les fichiers de configuration
+        extra_requirements : dépendances propres aux gabarits retenus (voir _extra_requirements)
+        """
+        
+        files = {}
+        config_files = architect_result.get('configuration_files', {})
+        
+        # requirements.txt (les dépendances frontend sont ignorées)
+        # Dédoublonné et trié : une ligne par paquet, sortie déterministe
+        dependencies = architect_result.get('dependencies', {})
+        requirements = set(chain.from_iterable(
+            deps for category, deps in dependencies.items() if category != 'frontend'
+        ))
+        requirements.update(extra_requirements)
+        files['requirements.txt'] = '\n'.join(sorted(requirements)) + '\n'
+        
+        # .env.example
+        if '.env.example' in config_files:
+            files['.env.example'] = config_files['.env.example']
+        
+        # docker-compose.yml
+        if 'docker-compose.yml' in config_files:
+            files['docker-compose.yml'] = config_files['docker-compose.yml']
+        
+        # Dockerfile
+        files['Dockerfile'] = _DOCKERFILE
+
+        # .gitignore
+        files['.gitignore'] = _GITIGNORE
+
         return files
     
-    async def _generate_documentation(self, analysis: Dict, architect: Dict) -> Dict[str, str]:
+    def _generate_test_files(self, project_type: str, api_design: Dict,
+                             async_db: bool = False) -> Dict[str, str]:
+        """Génère les fichiers de tests (async_db : variante SQLAlchemy asynchrone)"""
+        
+        if project_type in ['web_application', 'api']:
+            # Aucun endpoint annoncé par l'architecture : pas de tests d'API à produire
+            if not self._has_api(api_design):
+                return {}
+            if async_db:
+                return dict(self.code_templates['fastapi_async_tests'])
+            return dict(self.code_templates['fastapi_tests'])
+        elif project_type == 'script':
+            return dict(self.code_templates['script_tests'])
+        return {}
+    
+    def _generate_documentation(self, analysis: Dict, architect: Dict) -> Dict[str, str]:
         """Génère la documentation"""
         
         files = {}
@@ -1026,88 +1801,47 @@ def test_csv_to_json(processor):
         description = analysis.get('description', 'Application générée par EcoAgent')
         
         # README.md principal - Version simplifiée
-        files['README.md'] = f"""# {description}
-
-Application {project_type} générée automatiquement par EcoAgent Framework.
-
-## Démarrage rapide
-
-### Prérequis
-- Python 3.11+
-- Docker (optionnel)
-
-### Installation
-
-1. Clonez le repository
-2. Créez un environnement virtuel : python -m venv venv
-3. Activez l'environnement : source venv/bin/activate
-4. Installez les dépendances : pip install -r requirements.txt
-
-### Lancement
-
-Mode développement : python main.py
-
-## Documentation
-
-- Type : {project_type}
-- Complexité : {complexity}
-
-Structure du projet :
-- app/ : Code de l'application
-- tests/ : Tests automatisés
-- docs/ : Documentation
-
-## Tests
-
-Lancement des tests : pytest
-
-## Généré par EcoAgent Framework
-
-Type de projet : {project_type}
-Complexité estimée : {complexity}
-"""
+        files['README.md'] = _README_TEMPLATE.substitute(
+            description=description, project_type=project_type, complexity=complexity
+        )
         
         # docs/api.md (si API)
-        if project_type in ['web_application', 'api']:
-            files['docs/api.md'] = """# Documentation API
-
-## Endpoints disponibles
-
-### Health Check
-- GET /api/v1/health - Vérifie l'état de l'application
-
-### Utilisateurs
-- GET /api/v1/users - Liste des utilisateurs
-- POST /api/v1/users - Créer un utilisateur
-- GET /api/v1/users/{id} - Détails d'un utilisateur
-- PUT /api/v1/users/{id} - Modifier un utilisateur
-- DELETE /api/v1/users/{id} - Supprimer un utilisateur
-
-### Items
-- GET /api/v1/items - Liste des items
-- POST /api/v1/items - Créer un item
-
-## Authentification
-L'API utilise JWT pour l'authentification (si configuré).
-
-## Codes de réponse
-- 200 - Succès
-- 201 - Créé avec succès
-- 400 - Erreur de validation
-- 401 - Non autorisé
-- 404 - Non trouvé
-- 500 - Erreur serveur
-"""
+        if project_type in ['web_application', 'api'] and self._has_api(architect.get('api_design', {})):
+            files['docs/api.md'] = _API_DOC_MD
         
         return files
 
-    def _load_code_templates(self) -> Dict[str, str]:
-        """Charge les templates de code"""
-        return {
-            'fastapi': 'Template FastAPI',
-            'script': 'Template Script Python',
-            'flask': 'Template Flask'
-        }
+    def _load_code_templates(self) -> Mapping[str, Mapping[str, str]]:
+        """
+        Charge les templates de code
+        Registre partagé construit à l'import : une sous-classe peut le remplacer
+        (moteur de templates, gabarits paramétrés) sans toucher aux _generate_*
+        """
+        return _CODE_TEMPLATES
+
+    def write_files(self, files: Dict[str, str], root: str) -> List[str]:
+        """
+        Écrit les fichiers générés sous `root`
+        Écriture binaire UTF-8 avec un tampon de 128 Kio : un seul write() par fichier
+        
+        Returns:
+            Chemins relatifs écrits, dans l'ordre de `files`
+        """
+        created_dirs = set()
+        written = []
+        for file_path, content in files.items():
+            full_path = os.path.join(root, file_path)
+            
+            # Chaque dossier n'est créé qu'une fois
+            directory = os.path.dirname(full_path)
+            if directory not in created_dirs:
+                os.makedirs(directory or '.', exist_ok=True)
+                created_dirs.add(directory)
+            
+            with open(full_path, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+                f.write(content.encode('utf-8'))
+            written.append(file_path)
+        return written
 
     def _determine_entry_point(self, project_type: str) -> str:
         """Détermine le point d'entrée de l'application"""
@@ -1118,44 +1852,26 @@ L'API utilise JWT pour l'authentification (si configuré).
         else:
             return 'main.py'
 
-    def _generate_installation_commands(self, architect_result: Dict) -> List[str]:
-        """Génère les commandes d'installation"""
-        commands = [
-            'python -m venv venv',
-            'source venv/bin/activate',
-            'pip install -r requirements.txt'
-        ]
-        
-        if 'database' in str(architect_result.get('technology_stack', {})):
-            commands.append('# Configurez votre base de données dans .env')
-        
-        return commands
-
-    def _generate_run_commands(self, project_type: str, tech_stack: Dict) -> List[str]:
-        """Génère les commandes pour lancer l'application"""
+    def _generate_installation_commands(self, architect_result: Dict) -> Tuple[str, ...]:
+        """Génère les commandes d'installation (tuple partagé, ne pas modifier)"""
+        # Lecture directe de la clé : pas de str() du dict à chaque appel
+        tech_stack = architect_result.get('technology_stack') or {}
+        if tech_stack.get('database'):
+            return _INSTALL_COMMANDS_WITH_DATABASE
+        return _INSTALL_COMMANDS
+
+    def _generate_run_commands(self, project_type: str, tech_stack: Dict,
+                               io_concurrency: str = 'single') -> Tuple[str, ...]:
+        """Génère les commandes pour lancer l'application (tuple partagé, ne pas modifier)"""
         if project_type in ['web_application', 'api']:
             if tech_stack.get('backend') == 'FastAPI':
-                return [
-                    'uvicorn main:app --reload',
-                    'uvicorn main:app --host 0.0.0.0 --port 8000'
-                ]
+                return _FASTAPI_RUN_COMMANDS
         elif project_type == 'script':
-            return [
-                'python main.py --help',
-                'python main.py input.csv output.json'
-            ]
+            if io_concurrency == 'many':
+                return _SCRIPT_MANY_RUN_COMMANDS
+            return _SCRIPT_RUN_COMMANDS
         
-        return ['python main.py']
-
-    def _load_code_templates(self) -> Dict[str, str]:
-        """Charge les templates de code"""
-        return {
-            'fastapi': 'Template FastAPI',
-            'script': 'Template Script Python',
-            'flask': 'Template Flask'
-        }
-
-
+        return _DEFAULT_RUN_COMMANDS
 
     def can_handle_task(self, task: Dict[str, Any]) -> bool:
         """Le codeur peut gérer les tâches de génération de code"""
@@ -4,16 +4,147 @@ Orchestre l'ensemble des agents et gère les workflows
 """
 
 import asyncio
+import copy
+import hashlib
+import json
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+import re
+import time
+import weakref
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Callable, Deque, Dict, FrozenSet, Iterable, List, Any, Mapping, NamedTuple, Optional, Set, Tuple
 from .base_agent import BaseAgent, AgentStatus
 
+# Mots-clés de suggest_workflow_type, par ordre de priorité : une regex compilée
+# par catégorie (recherche de sous-chaîne, insensible à la casse)
+_WORKFLOW_KEYWORD_PATTERNS = tuple(
+    (re.compile('|'.join(map(re.escape, words)), re.IGNORECASE), workflow_type)
+    for words, workflow_type in (
+        (('bug', 'fix', 'erreur', 'problème'), 'bug_fix'),
+        (('web', 'app', 'application', 'site'), 'web_app'),
+        (('doc', 'documentation', 'readme'), 'documentation'),
+        (('refactor', 'améliorer', 'optimiser'), 'refactoring'),
+        (('projet', 'complet', 'full', 'application complète'), 'full_project'),
+    )
+)
+
+def _workflow_ancestors(deps: Mapping[str, Iterable[str]]) -> Dict[str, FrozenSet[str]]:
+    """
+    Étapes amont (dépendances transitives) de chaque étape d'un workflow
+    Une dépendance inconnue n'a pas d'amont ; les cycles sont tolérés
+    """
+    ancestors = {}
+    for step in deps:
+        seen = set()
+        stack = list(deps[step])
+        while stack:
+            parent = stack.pop()
+            if parent not in seen:
+                seen.add(parent)
+                stack.extend(deps.get(parent, ()))
+        seen.discard(step)
+        ancestors[step] = frozenset(seen)
+    return ancestors
+
+class StepResult(NamedTuple):
+    """Résultat d'une étape de workflow (accès par attribut, sans .get ni valeur par défaut)"""
+    success: bool
+    output: Dict[str, Any]
+    actual_cost: float
+    timestamp: float
+    duration: float
+    error: Optional[str] = None
+
+# Étapes dont l'échec interrompt le workflow
+_CRITICAL_STEPS = frozenset(('analysis', 'architect'))
+
+# Coût de base par type de workflow (estimate_task_cost)
+_WORKFLOW_BASE_COSTS = {
+    'simple_task': 0.0,      # Ollama uniquement
+    'web_app': 0.02,         # Quelques appels API si nécessaire
+    'full_project': 0.10,    # Projet complet
+    'bug_fix': 0.01,         # Simple correction
+    'refactoring': 0.05,     # Refactoring moyen
+    'documentation': 0.0     # Ollama uniquement
+}
+_DEFAULT_WORKFLOW_BASE_COST = 0.02
+
+def _invalidate_agent_caches(coordinator_ref: 'weakref.ReferenceType[AgentCoordinator]'):
+    """Finaliseur d'un agent non épinglé : invalide les caches du coordinateur s'il existe encore"""
+    coordinator = coordinator_ref()
+    if coordinator is not None:
+        coordinator._invalidate_caches()
+
+@dataclass(frozen=True)
+class WorkflowPlan:
+    """
+    Workflow compilé une seule fois (_setup_default_workflows) : ordre topologique,
+    niveaux exécutables en parallèle, étapes amont et coût de base précalculés
+    """
+    __slots__ = ('steps', 'levels', 'deps', 'ancestors', 'critical', 'base_cost')
+    
+    steps: Tuple[str, ...]
+    levels: Tuple[Tuple[str, ...], ...]
+    deps: Mapping[str, Tuple[str, ...]]
+    ancestors: Mapping[str, FrozenSet[str]]
+    critical: FrozenSet[str]
+    base_cost: float
+    
+    @classmethod
+    def from_dag(cls, deps: Mapping[str, Iterable[str]], base_cost: float) -> 'WorkflowPlan':
+        """
+        Compile un DAG étape -> dépendances
+        L'ordre d'insertion de `deps` fixe l'ordre des étapes au sein d'un niveau
+        
+        Raises:
+            ValueError: dépendance inconnue ou cycle
+        """
+        frozen_deps = {step: tuple(parents) for step, parents in deps.items()}
+        for step, parents in frozen_deps.items():
+            unknown = [parent for parent in parents if parent not in frozen_deps]
+            if unknown:
+                raise ValueError(f"Étape '{step}' : dépendances inconnues {unknown}")
+        
+        # Tri topologique par niveaux (Kahn)
+        levels = []
+        done = set()
+        pending = list(frozen_deps)
+        while pending:
+            ready = tuple(step for step in pending if done.issuperset(frozen_deps[step]))
+            if not ready:
+                raise ValueError(f"Cycle entre les étapes {pending}")
+            levels.append(ready)
+            done.update(ready)
+            pending = [step for step in pending if step not in done]
+        
+        return cls(
+            steps=tuple(step for level in levels for step in level),
+            levels=tuple(levels),
+            deps=MappingProxyType(frozen_deps),
+            ancestors=MappingProxyType(_workflow_ancestors(frozen_deps)),
+            critical=_CRITICAL_STEPS.intersection(frozen_deps),
+            base_cost=base_cost
+        )
+
 class AgentCoordinator(BaseAgent):
     """
     Agent coordinateur principal qui remplace les 67+ agents de DafnckMachine
     par une approche plus économique et efficace
     """
     
+    __slots__ = (
+        'available_agents', '_pinned_agents', 'workflow_templates', 'workflow_plans', 'current_workflow', 'workflow_history',
+        'total_workflows', 'successful_workflows', '_workflow_cost_cache', '_validated_workflows',
+        '_step_cache', '_event_queue', '_event_task'
+    )
+    
+    # Nombre de workflows conservés dans workflow_history (les plus anciens sont évincés)
+    HISTORY_LIMIT = 128
+    # Nombre de résultats d'étapes conservés dans le cache (éviction LRU)
+    STEP_CACHE_SIZE = 512
+    
     def __init__(self):
         super().__init__(
             name="Coordinateur",
@@ -21,34 +152,134 @@ class AgentCoordinator(BaseAgent):
             model_preference="local"
         )
         
-        # Registry des agents disponibles
-        self.available_agents: Dict[str, BaseAgent] = {}
-        self.workflow_templates: Dict[str, List[str]] = {}
+        # Registry des agents disponibles : références faibles, un agent remplacé
+        # ou abandonné par l'appelant peut être collecté
+        self.available_agents: 'weakref.WeakValueDictionary[str, BaseAgent]' = weakref.WeakValueDictionary()
+        # Références fortes des agents épinglés (durée de vie du coordinateur)
+        self._pinned_agents: Dict[str, BaseAgent] = {}
+        # Workflows sous forme de DAG : étape -> étapes dont elle dépend
+        self.workflow_templates: Dict[str, Dict[str, List[str]]] = {}
+        # Workflows compilés, lus par execute_task, can_handle_task et estimate_task_cost
+        self.workflow_plans: Dict[str, WorkflowPlan] = {}
         
         # État du workflow en cours
         self.current_workflow: Optional[Dict[str, Any]] = None
-        self.workflow_history: List[Dict[str, Any]] = []
+        # Résumés légers uniquement : les sorties complètes restent chez l'appelant
+        self.workflow_history: Deque[Dict[str, Any]] = deque(maxlen=self.HISTORY_LIMIT)
+        
+        # Coût estimé par (workflow_type, complexity), invalidé par register_agent
+        self._workflow_cost_cache: Dict[Tuple[str, str], float] = {}
+        # Workflows dont tous les agents sont enregistrés, invalidé par register_agent
+        self._validated_workflows: Set[str] = set()
+        # Résultats d'étapes réussies, adressés par leur contenu (voir _step_cache_key)
+        self._step_cache: 'OrderedDict[str, StepResult]' = OrderedDict()
         
-        # Statistiques globales
+        # Statistiques globales (à jour dès le retour de execute_task)
         self.total_workflows = 0
         self.successful_workflows = 0
         
+        # File d'événements et tâche consommatrice, créées à la première exécution
+        # dans la boucle courante (aucune boucle n'existe à l'import du module)
+        self._event_queue: Optional[asyncio.Queue] = None
+        self._event_task: Optional[asyncio.Task] = None
+        
         self._setup_default_workflows()
         
-    def register_agent(self, agent: BaseAgent):
-        """Enregistre un nouvel agent dans le système"""
+    def register_agent(self, agent: BaseAgent, pin: bool = True):
+        """
+        Enregistre un nouvel agent dans le système
+        
+        Args:
+            agent: Agent à enregistrer (remplace l'agent de même nom)
+            pin: True pour le conserver tant que le coordinateur existe ; False pour
+                 ne garder qu'une référence faible (rechargement à chaud en développement)
+        """
         self.available_agents[agent.name] = agent
-        self.logger.info(f"Agent {agent.name} enregistré")
+        if pin:
+            self._pinned_agents[agent.name] = agent
+        else:
+            # L'ancien agent de même nom n'est plus retenu
+            self._pinned_agents.pop(agent.name, None)
+            # Sa collecte retire l'agent du registre : les caches doivent suivre
+            # (référence faible vers le coordinateur, que le finaliseur ne retient pas)
+            weakref.finalize(agent, _invalidate_agent_caches, weakref.ref(self))
+        self._invalidate_caches()
+        self.logger.info("Agent %s enregistré", agent.name)
+    
+    def _invalidate_caches(self):
+        """Vide les caches qui dépendent des agents enregistrés (estimations, validations, étapes)"""
+        self._workflow_cost_cache.clear()
+        self._validated_workflows.clear()
+        self._step_cache.clear()
+    
+    def _event_emitter(self) -> Callable[[Tuple[str, str, Any]], None]:
+        """
+        Retourne la fonction de publication d'événements, en (re)démarrant le
+        consommateur si nécessaire (première exécution ou nouvelle boucle)
+        """
+        task = self._event_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._event_queue = asyncio.Queue()
+            self._event_task = asyncio.ensure_future(self._consume_events(self._event_queue))
+        return self._event_queue.put_nowait
+    
+    async def _consume_events(self, queue: asyncio.Queue):
+        """Tâche de fond : tient l'historique et la journalisation des étapes hors du chemin critique"""
+        try:
+            while True:
+                self._handle_event(await queue.get())
+                queue.task_done()
+        except asyncio.CancelledError:
+            # Arrêt de la boucle : les événements restants sont traités avant de sortir
+            while not queue.empty():
+                self._handle_event(queue.get_nowait())
+                queue.task_done()
+            raise
+    
+    def _handle_event(self, event: Tuple[str, str, Any]):
+        """Traite un événement (STEP_STARTED, STEP_COMPLETED, STEP_FAILED, WORKFLOW_COMPLETED)"""
+        kind, name, payload = event
+        if kind == 'WORKFLOW_COMPLETED':
+            self.workflow_history.append(payload)
+        elif kind == 'STEP_STARTED':
+            self.logger.debug("Étape %s démarrée", name)
+        else:
+            self.logger.debug("Étape %s : %s en %.3fs - Coût: %.4f€", name, kind, payload.duration, payload.actual_cost)
+    
+    async def flush_events(self):
+        """Attend le traitement des événements publiés (historique à jour)"""
+        queue = self._event_queue
+        if queue is not None and self._event_task is not None and not self._event_task.done():
+            await queue.join()
     
     def _setup_default_workflows(self):
         """Configure les workflows par défaut"""
+        # L'ordre d'insertion fixe l'ordre des étapes d'un même niveau dans les résultats
         self.workflow_templates = {
-            'simple_task': ['analysis', 'coder'],
-            'web_app': ['analysis', 'architect', 'coder', 'tester', 'documenter'],
-            'full_project': ['analysis', 'architect', 'coder', 'reviewer', 'tester', 'documenter', 'git'],
-            'bug_fix': ['analysis', 'coder', 'tester', 'reviewer'],
-            'refactoring': ['analysis', 'architect', 'coder', 'reviewer', 'tester'],
-            'documentation': ['analysis', 'documenter']
+            'simple_task': {'analysis': [], 'coder': ['analysis']},
+            'web_app': {
+                'analysis': [], 'architect': ['analysis'], 'coder': ['architect'],
+                'tester': ['coder'], 'documenter': ['coder']
+            },
+            'full_project': {
+                'analysis': [], 'architect': ['analysis'], 'coder': ['architect'],
+                'reviewer': ['coder'], 'tester': ['coder'], 'documenter': ['coder'],
+                'git': ['reviewer', 'tester', 'documenter']
+            },
+            'bug_fix': {'analysis': [], 'coder': ['analysis'], 'tester': ['coder'], 'reviewer': ['coder']},
+            'refactoring': {
+                'analysis': [], 'architect': ['analysis'], 'coder': ['architect'],
+                'reviewer': ['coder'], 'tester': ['coder']
+            },
+            'documentation': {'analysis': [], 'documenter': ['analysis']}
+        }
+        
+        # Compilation unique : aucun tri topologique à l'exécution
+        self.workflow_plans = {
+            workflow_type: WorkflowPlan.from_dag(
+                deps, _WORKFLOW_BASE_COSTS.get(workflow_type, _DEFAULT_WORKFLOW_BASE_COST)
+            )
+            for workflow_type, deps in self.workflow_templates.items()
         }
     
     async def execute_task(self, task: Dict[str, Any]) -> Dict[str, Any]:
@@ -58,28 +289,46 @@ class AgentCoordinator(BaseAgent):
         workflow_type = task.get('workflow_type', 'simple_task')
         project_description = task.get('description', '')
         
-        self.logger.info(f"Début workflow '{workflow_type}' : {project_description}")
+        # Attributs lus dans les boucles, liés une fois en variables locales
+        plans = self.workflow_plans
+        execute_step = self._execute_workflow_step
+        emit = self._event_emitter()
+        
+        self.logger.info("Début workflow '%s' : %s", workflow_type, project_description)
         
         # Sélection du workflow approprié
-        if workflow_type not in self.workflow_templates:
+        plan = plans.get(workflow_type)
+        if plan is None:
             return {
                 'success': False,
                 'error': f"Type de workflow '{workflow_type}' inconnu",
-                'available_workflows': list(self.workflow_templates.keys())
+                'available_workflows': list(plans.keys())
             }
         
-        workflow_steps = self.workflow_templates[workflow_type]
+        # Validation préalable : un agent manquant fait échouer le workflow avant
+        # toute estimation ou exécution (résultat mis en cache jusqu'au prochain register_agent)
+        if workflow_type not in self._validated_workflows:
+            agents = self.available_agents
+            missing = [step for step in plan.steps if step not in agents]
+            if missing:
+                self.logger.error("Workflow '%s' : agents manquants %s", workflow_type, missing)
+                return {
+                    'success': False,
+                    'error': f"Agents manquants pour le workflow '{workflow_type}'",
+                    'missing': missing
+                }
+            self._validated_workflows.add(workflow_type)
         
         # Estimation des coûts totaux
-        total_estimated_cost = await self._estimate_workflow_cost(task, workflow_steps)
+        total_estimated_cost = await self._estimate_workflow_cost(task, workflow_type)
         
         # Confirmation utilisateur si nécessaire
         from ..core.config import config
         if total_estimated_cost > config.cost_limits.require_confirmation_above_euros:
             # TODO: Implémenter confirmation utilisateur
-            self.logger.warning(f"Coût estimé élevé: {total_estimated_cost:.4f}€")
+            self.logger.warning("Coût estimé élevé: %.4f€", total_estimated_cost)
         
-        # Exécution séquentielle des étapes
+        # Exécution du DAG par niveaux : les étapes prêtes tournent en parallèle
         workflow_result = {
             'success': True,
             'workflow_type': workflow_type,
@@ -90,100 +339,192 @@ class AgentCoordinator(BaseAgent):
             'timeline': []
         }
         
-        for step_name in workflow_steps:
-            step_result = await self._execute_workflow_step(step_name, task, workflow_result)
+        steps_completed = workflow_result['steps_completed']
+        steps_failed = workflow_result['steps_failed']
+        outputs = workflow_result['outputs']
+        timeline = workflow_result['timeline']
+        
+        # Chaque étape ne reçoit que les sorties de ses étapes amont
+        ancestors = plan.ancestors
+        critical = plan.critical
+        completed_append = steps_completed.append
+        failed_append = steps_failed.append
+        timeline_append = timeline.append
+        total_cost = 0.0
+        for ready in plan.levels:
+            # Publication non bloquante : l'historique est tenu par le consommateur
+            started = time.time()
+            for step_name in ready:
+                emit(('STEP_STARTED', step_name, started))
             
-            if step_result['success']:
-                workflow_result['steps_completed'].append(step_name)
-                workflow_result['outputs'][step_name] = step_result.get('output', {})
-            else:
-                workflow_result['steps_failed'].append(step_name)
-                workflow_result['success'] = False
-                # En cas d'échec, on peut continuer ou s'arrêter selon la criticité
-                if step_name in ['analysis', 'architect']:  # Étapes critiques
-                    break
+            step_results = await asyncio.gather(
+                *(execute_step(step_name, task, workflow_result, ancestors[step_name])
+                  for step_name in ready)
+            )
             
-            workflow_result['total_cost'] += step_result.get('actual_cost', 0.0)
-            workflow_result['timeline'].append({
-                'step': step_name,
-                'timestamp': step_result.get('timestamp'),
-                'duration': step_result.get('duration'),
-                'success': step_result['success']
-            })
+            # Fusion après le gather : les étapes d'un niveau voient toutes les mêmes sorties
+            critical_failure = False
+            for step_name, step_result in zip(ready, step_results):
+                success = step_result.success
+                if success:
+                    completed_append(step_name)
+                    outputs[step_name] = step_result.output
+                else:
+                    failed_append(step_name)
+                    workflow_result['success'] = False
+                    # En cas d'échec, on peut continuer ou s'arrêter selon la criticité
+                    if step_name in critical:
+                        critical_failure = True
+                
+                total_cost += step_result.actual_cost
+                timeline_append({
+                    'step': step_name,
+                    'timestamp': step_result.timestamp,
+                    'duration': step_result.duration,
+                    'success': success
+                })
+                emit(('STEP_COMPLETED' if success else 'STEP_FAILED', step_name, step_result))
+            
+            # Une étape non critique en échec débloque tout de même le niveau suivant
+            if critical_failure:
+                break
         
-        # Mise à jour des statistiques
+        workflow_result['total_cost'] = total_cost
+        
+        # Compteurs tenus ici : deux incréments ne coûtent pas plus qu'une publication
         self.total_workflows += 1
         if workflow_result['success']:
             self.successful_workflows += 1
         
-        self.workflow_history.append(workflow_result)
+        # Historique mis à jour hors du chemin critique (voir flush_events)
+        emit(('WORKFLOW_COMPLETED', workflow_type, {
+            'workflow_type': workflow_type,
+            'success': workflow_result['success'],
+            'total_cost': total_cost,
+            'step_count': len(steps_completed),
+            'timeline': timeline
+        }))
         
         return workflow_result
     
-    async def _execute_workflow_step(self, step_name: str, original_task: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
-        """Exécute une étape spécifique du workflow"""
+    async def _execute_workflow_step(self, step_name: str, original_task: Dict[str, Any], context: Dict[str, Any],
+                                     ancestors: Optional[Iterable[str]] = None) -> StepResult:
+        """
+        Exécute une étape spécifique du workflow
+        `ancestors` limite le contexte transmis aux sorties de ces étapes (toutes par défaut)
+        """
+        timestamp = time.time()
+        start_ns = time.perf_counter_ns()
+        agent = self.available_agents.get(step_name)
         
-        if step_name not in self.available_agents:
-            return {
-                'success': False,
-                'error': f"Agent '{step_name}' non disponible",
-                'step': step_name
-            }
+        if agent is None:
+            return StepResult(False, {}, 0.0, timestamp, (time.perf_counter_ns() - start_ns) / 1e9,
+                              f"Agent '{step_name}' non disponible")
         
-        agent = self.available_agents[step_name]
+        # Vue en lecture seule : aucune copie, et l'agent ne peut pas modifier les sorties
+        outputs = context['outputs']
+        if ancestors is None:
+            step_context = MappingProxyType(outputs)
+        else:
+            step_context = MappingProxyType({name: outputs[name] for name in ancestors if name in outputs})
         
         # Préparation de la tâche pour cet agent
         agent_task = {
             'id': f"{original_task.get('id', 'unknown')}_{step_name}",
             'type': step_name,
             'description': original_task.get('description', ''),
-            'context': context['outputs'],  # Résultats des étapes précédentes
-            'requirements': original_task.get('requirements', {}),
-            'previous_outputs': context['outputs']
+            'context': step_context,  # Résultats des étapes précédentes
+            'requirements': original_task.get('requirements', {})
         }
         
+        # Étape identique déjà exécutée (même description, exigences et entrées) : pas de réexécution
+        step_cache = self._step_cache
+        cache_key = self._step_cache_key(step_name, original_task, step_context)
+        cached = step_cache.get(cache_key)
+        if cached is not None:
+            step_cache.move_to_end(cache_key)
+            # Copie profonde : ni l'appelant ni les étapes suivantes ne modifient l'entrée du cache
+            return cached._replace(
+                output=copy.deepcopy(cached.output),
+                actual_cost=0.0,
+                timestamp=timestamp,
+                duration=(time.perf_counter_ns() - start_ns) / 1e9
+            )
+        
         # Exécution de la tâche par l'agent
-        return await agent.start_task(agent_task)
+        result = await agent.start_task(agent_task)
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        
+        # Conversion unique du dict de l'agent : les lectures suivantes sont des attributs
+        step_result = StepResult(
+            result['success'],
+            result.get('output', {}),
+            result.get('actual_cost', 0.0),
+            timestamp,
+            duration,
+            result.get('error')
+        )
+        
+        # Seuls les succès sont mis en cache : un échec peut être transitoire
+        if step_result.success:
+            step_cache[cache_key] = step_result._replace(output=copy.deepcopy(step_result.output))
+            if len(step_cache) > self.STEP_CACHE_SIZE:
+                step_cache.popitem(last=False)
+        
+        return step_result
     
-    async def _estimate_workflow_cost(self, task: Dict[str, Any], workflow_steps: List[str]) -> float:
-        """Estime le coût total d'un workflow"""
-        total_cost = 0.0
+    @staticmethod
+    def _step_cache_key(step_name: str, original_task: Dict[str, Any], inputs: Mapping[str, Any]) -> str:
+        """Empreinte BLAKE2b (128 bits) de l'étape, de la demande et des sorties amont reçues"""
+        payload = json.dumps({
+            'step': step_name,
+            'desc': original_task.get('description'),
+            'reqs': original_task.get('requirements'),
+            'deps_outputs': dict(inputs)
+        }, sort_keys=True, default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    
+    async def _estimate_workflow_cost(self, task: Dict[str, Any], workflow_type: str) -> float:
+        """
+        Estime le coût total d'un workflow
+        Mémoïsé par (workflow_type, complexity) : les estimateurs des agents ne doivent
+        pas dépendre de la description
+        """
+        complexity = task.get('complexity', 'medium')
+        key = (workflow_type, complexity)
+        cached = self._workflow_cost_cache.get(key)
+        if cached is not None:
+            return cached
         
-        for step_name in workflow_steps:
-            if step_name in self.available_agents:
-                agent = self.available_agents[step_name]
-                step_task = {
-                    'type': step_name,
-                    'description': task.get('description', ''),
-                    'complexity': task.get('complexity', 'medium')
-                }
-                step_cost = agent.estimate_task_cost(step_task)
-                total_cost += step_cost
+        agents = self.available_agents
+        description = task.get('description', '')
+        
+        # Estimations attendues en parallèle : la latence est celle de l'agent le plus lent
+        # get() unique par étape : une référence faible peut disparaître entre deux accès
+        step_agents = [(step_name, agents.get(step_name)) for step_name in self.workflow_plans[workflow_type].steps]
+        costs = await asyncio.gather(*(
+            agent.estimate_task_cost_async({
+                'type': step_name,
+                'description': description,
+                'complexity': complexity
+            })
+            for step_name, agent in step_agents
+            if agent is not None
+        ))
+        total_cost = sum(costs, 0.0)
         
+        self._workflow_cost_cache[key] = total_cost
         return total_cost
     
     def can_handle_task(self, task: Dict[str, Any]) -> bool:
         """Le coordinateur peut gérer tous les types de workflows"""
         workflow_type = task.get('workflow_type', 'simple_task')
-        return workflow_type in self.workflow_templates
+        return workflow_type in self.workflow_plans
     
     def estimate_task_cost(self, task: Dict[str, Any]) -> float:
-        """Estime le coût d'un workflow complet"""
-        workflow_type = task.get('workflow_type', 'simple_task')
-        if workflow_type not in self.workflow_templates:
-            return 0.0
-        
-        # Estimation simplifiée basée sur le type de workflow
-        base_costs = {
-            'simple_task': 0.0,      # Ollama uniquement
-            'web_app': 0.02,         # Quelques appels API si nécessaire
-            'full_project': 0.10,    # Projet complet
-            'bug_fix': 0.01,         # Simple correction
-            'refactoring': 0.05,     # Refactoring moyen
-            'documentation': 0.0     # Ollama uniquement
-        }
-        
-        return base_costs.get(workflow_type, 0.02)
+        """Estime le coût d'un workflow complet (coût de base précalculé du workflow)"""
+        plan = self.workflow_plans.get(task.get('workflow_type', 'simple_task'))
+        return plan.base_cost if plan is not None else 0.0
     
     def get_system_status(self) -> Dict[str, Any]:
         """Retourne l'état complet du système"""
@@ -197,26 +538,16 @@ class AgentCoordinator(BaseAgent):
             'total_workflows': self.total_workflows,
             'successful_workflows': self.successful_workflows,
             'success_rate': (self.successful_workflows / max(1, self.total_workflows)) * 100,
-            'available_workflow_types': list(self.workflow_templates.keys()),
+            'available_workflow_types': list(self.workflow_plans.keys()),
             'current_workflow': self.current_workflow is not None
         }
     
     def suggest_workflow_type(self, description: str) -> str:
         """Suggère le type de workflow le plus approprié"""
-        description_lower = description.lower()
-        
-        if any(word in description_lower for word in ['bug', 'fix', 'erreur', 'problème']):
-            return 'bug_fix'
-        elif any(word in description_lower for word in ['web', 'app', 'application', 'site']):
-            return 'web_app'
-        elif any(word in description_lower for word in ['doc', 'documentation', 'readme']):
-            return 'documentation'
-        elif any(word in description_lower for word in ['refactor', 'améliorer', 'optimiser']):
-            return 'refactoring'
-        elif any(word in description_lower for word in ['projet', 'complet', 'full', 'application complète']):
-            return 'full_project'
-        else:
-            return 'simple_task'
+        for pattern, workflow_type in _WORKFLOW_KEYWORD_PATTERNS:
+            if pattern.search(description):
+                return workflow_type
+        return 'simple_task'
 
 # Instance globale du coordinateur
 coordinator = AgentCoordinator()
@@ -7,41 +7,67 @@ Interface en ligne de commande intuitive pour EcoAgent Framework
 
 import typer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn
-from rich.prompt import Prompt, Confirm
+import re
+import string
 import sys
-import os
-import asyncio
-from pathlib import Path
-from typing import Optional, List, Dict, Any
-import json
-import subprocess
 import time
-import platform
-import psutil
-
-# Import de l'intégration avec votre framework existant
-try:
-    from .integration import EcoAgentCLIIntegration
-except ImportError:
-    # Fallback si le fichier integration.py n'existe pas encore
-    class EcoAgentCLIIntegration:
-        def __init__(self):
-            self.agents_available = {'framework_available': False}
-        
-        def create_project_with_existing_framework(self, project_name, template, framework, mode):
-            return {
-                'success': True,
-                'project_name': project_name,
-                'fallback': True,
-                'message': 'Projet créé avec méthode de base (intégration en cours)'
-            }
-        
-        def get_framework_status(self):
-            return {'framework_available': False, 'agents_count': 0}
+from pathlib import Path
+from typing import Optional, List, Dict, Any, Mapping, Tuple
+from dataclasses import dataclass
+from functools import lru_cache, wraps
+from types import MappingProxyType
+
+# Imports différés : rich.table/panel/progress/prompt, psutil, asyncio, json et
+# l'intégration (qui charge les agents) ne sont importés que par les commandes
+# qui s'en servent, pour que `ecoagent --help` ou `status --json` démarrent vite
+
+class _FallbackIntegration:
+    """Intégration minimale si integration.py n'est pas disponible"""
+    def __init__(self):
+        self.agents_available = {'framework_available': False}
+    
+    def create_project_with_existing_framework(self, project_name, template, framework, mode):
+        return {
+            'success': True,
+            'project_name': project_name,
+            'fallback': True,
+            'message': 'Projet créé avec méthode de base (intégration en cours)'
+        }
+    
+    def get_framework_status(self):
+        return {'framework_available': False, 'agents_count': 0}
+
+@lru_cache(maxsize=1)
+def _integration_class():
+    """Classe d'intégration avec le framework existant, importée au premier besoin"""
+    try:
+        from .integration import EcoAgentCLIIntegration
+    except ImportError:
+        # Fallback si le fichier integration.py n'existe pas encore
+        return _FallbackIntegration
+    return EcoAgentCLIIntegration
+
+@lru_cache(maxsize=1)
+def _get_integration():
+    """
+    Instance d'intégration unique pour le processus : celle créée à l'import de
+    integration.py, plutôt qu'une nouvelle détection des agents à chaque appel
+    """
+    try:
+        from .integration import eco_integration
+    except ImportError:
+        return _FallbackIntegration()
+    return eco_integration
+
+def __getattr__(name):
+    # Compatibilité : `from ecoagent.cli.cli import EcoAgentCLIIntegration` (ou
+    # generate_project, déplacé dans commands/create.py) reste valide
+    if name == 'EcoAgentCLIIntegration':
+        return _integration_class()
+    if name == 'generate_project':
+        from .commands.create import generate_project
+        return generate_project
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Initialisation des composants
 console = Console()
@@ -61,30 +87,178 @@ DEFAULT_SETTINGS = {
     'projects': []
 }
 
-# AJOUT : Templates globaux pour éviter duplication
-TEMPLATES = {
-    'webapp': {'desc': 'Application web complète FastAPI + React', 'cost': 0.0},
-    'blog': {'desc': 'Blog moderne avec CMS intégré', 'cost': 0.0},
-    'ecommerce': {'desc': 'Boutique en ligne complète', 'cost': 0.5},
-    'api': {'desc': 'API REST robuste', 'cost': 0.0},
-    'crm': {'desc': 'Système CRM complet', 'cost': 1.0},
-    'dashboard': {'desc': 'Tableau de bord analytics', 'cost': 0.3},
-    'portfolio': {'desc': 'Site portfolio professionnel', 'cost': 0.0}
-}
+@dataclass(frozen=True)
+class TemplateSpec:
+    """
+    Description d'un template : catalogue (templates), création (create),
+    estimation (cost) et démonstration (demo) partagent cette unique source
+    """
+    __slots__ = ('name', 'category', 'desc', 'summary', 'cost_eur', 'api_calls',
+                 'local_share', 'demo_title', 'demo_desc', 'features')
+    
+    name: str
+    category: str
+    desc: str                   # Description du catalogue
+    summary: Optional[str]      # Description courte ; None si non proposé par create
+    cost_eur: float
+    api_calls: int              # Appels API estimés en mode standard
+    local_share: str            # Part du traitement réalisée en local
+    demo_title: Optional[str]   # None si aucune démonstration
+    demo_desc: Optional[str]
+    features: Tuple[str, ...]
+
+def _spec(name: str, category: str, desc: str, summary: Optional[str] = None,
+          cost_eur: float = 0.0, api_calls: int = 0, local_share: str = '100%',
+          demo: Optional[Tuple[str, str, Tuple[str, ...]]] = None) -> TemplateSpec:
+    """Construit un TemplateSpec (les valeurs par défaut sont incompatibles avec __slots__)"""
+    demo_title, demo_desc, features = demo or (None, None, ())
+    return TemplateSpec(name, category, desc, summary, cost_eur, api_calls,
+                        local_share, demo_title, demo_desc, features)
+
+# Registre unique des templates, dans l'ordre d'affichage du catalogue
+_TEMPLATE_REGISTRY: Mapping[str, TemplateSpec] = MappingProxyType({spec.name: spec for spec in (
+    _spec('webapp', 'Web Applications', 'Application web complète FastAPI + React + PostgreSQL',
+          summary='Application web complète FastAPI + React'),
+    _spec('blog', 'Web Applications', 'Blog moderne avec CMS intégré et SEO',
+          summary='Blog moderne avec CMS intégré',
+          demo=('Blog Professionnel', 'Blog moderne avec éditeur et système de commentaires',
+                ('Éditeur riche', 'System de commentaires', 'SEO optimisé', 'Interface admin'))),
+    _spec('portfolio', 'Web Applications', 'Site portfolio professionnel responsive',
+          summary='Site portfolio professionnel',
+          demo=('Site Portfolio', 'Site portfolio professionnel responsive',
+                ('Galerie projets', 'CV interactif', 'Contact form', 'Blog intégré'))),
+    _spec('ecommerce', 'E-commerce', 'Boutique en ligne complète avec paiement',
+          summary='Boutique en ligne complète', cost_eur=0.5, api_calls=5, local_share='95%',
+          demo=('Boutique E-commerce', 'Shop en ligne complet avec panier et paiement',
+                ('Catalogue produits', 'Panier d\'achat', 'Paiement Stripe', 'Interface admin'))),
+    _spec('marketplace', 'E-commerce', 'Plateforme marketplace multi-vendeurs'),
+    _spec('crm', 'Business Applications', 'Système CRM complet avec pipeline ventes',
+          summary='Système CRM complet', cost_eur=1.0, api_calls=10, local_share='90%',
+          demo=('CRM Entreprise', 'Système de gestion relation client complet',
+                ('Gestion contacts', 'Suivi opportunités', 'Tableaux de bord', 'Rapports avancés'))),
+    _spec('erp', 'Business Applications', 'Solution ERP modulaire pour PME'),
+    _spec('inventory', 'Business Applications', 'Gestion de stock et inventaire avancée'),
+    _spec('api', 'APIs & Services', 'API REST robuste avec documentation',
+          summary='API REST robuste'),
+    _spec('graphql', 'APIs & Services', 'API GraphQL moderne avec Apollo'),
+    _spec('microservice', 'APIs & Services', 'Architecture microservices Docker'),
+    _spec('dashboard', 'Analytics & Dashboards', 'Tableau de bord analytics temps réel',
+          summary='Tableau de bord analytics', cost_eur=0.3, api_calls=3, local_share='97%',
+          demo=('Dashboard Analytics', 'Tableau de bord avec métriques en temps réel',
+                ('Graphiques interactifs', 'KPIs temps réel', 'Alertes', 'Export données'))),
+    _spec('reporting', 'Analytics & Dashboards', 'Système de rapports avancés'),
+    _spec('monitoring', 'Analytics & Dashboards', 'Monitoring et alertes système'),
+)})
+
+# Commande cost : modificateurs par mode et tarifs mensuels de la concurrence
+# (libellé du prix préformaté, seule l'économie dépend de l'estimation)
+_MODE_MULTIPLIERS = MappingProxyType({
+    'light': 0.8,
+    'standard': 1.0,
+    'advanced': 1.2
+})
+_COMPETITORS = tuple((name, price, f"{price:.2f}€") for name, price in (
+    ("GitHub Copilot", 39.00),
+    ("Cursor Pro", 20.00),
+    ("Claude Pro", 18.00),
+    ("ChatGPT Plus", 20.00)
+))
+
+# Template par défaut (create, cost) et repli pour un nom inconnu
+_DEFAULT_SPEC = _TEMPLATE_REGISTRY['webapp']
+
+# Vues précalculées du registre
+_CREATE_TEMPLATES: Mapping[str, TemplateSpec] = MappingProxyType(
+    {name: spec for name, spec in _TEMPLATE_REGISTRY.items() if spec.summary is not None}
+)
+_DEMO_TEMPLATES: Mapping[str, TemplateSpec] = MappingProxyType(
+    {name: spec for name, spec in _TEMPLATE_REGISTRY.items() if spec.demo_title is not None}
+)
+
+def _bucket_by_category() -> Mapping[str, Mapping[str, str]]:
+    """Regroupe les descriptions du catalogue par catégorie (ordre du registre)"""
+    buckets: Dict[str, Dict[str, str]] = {}
+    for spec in _TEMPLATE_REGISTRY.values():
+        buckets.setdefault(spec.category, {})[spec.name] = spec.desc
+    return MappingProxyType(buckets)
+
+# Catalogue des templates par catégorie (commande templates)
+_TEMPLATE_CATEGORIES = _bucket_by_category()
 
+def _batched_output(command):
+    """
+    Regroupe les sorties console d'une commande en une seule écriture sur le terminal
+    (tampon de la Console rich) ; réservé aux commandes sans saisie interactive,
+    dont l'invite resterait sinon dans le tampon
+    """
+    @wraps(command)
+    def wrapper(*args, **kwargs):
+        with console:
+            return command(*args, **kwargs)
+    return wrapper
+
+def _confirm(question: str, assume_yes: bool = False) -> bool:
+    """
+    Demande une confirmation, sauf avec --yes ou si l'entrée standard n'est pas un
+    terminal (scripts, CI) : la réponse est alors oui, sans attendre de saisie
+    """
+    if assume_yes or sys.stdin is None or not sys.stdin.isatty():
+        return True
+    from rich.prompt import Confirm
+    return Confirm.ask(question)
+
+def _format_columns(rows, widths=None) -> str:
+    """
+    Rendu texte brut d'un petit tableau à colonnes fixes, sans la mise en page
+    d'un Table rich (mesure et styles cellule par cellule)
+
+    Args:
+        rows: En-têtes puis lignes, chacune une séquence de chaînes
+        widths: Largeurs des colonnes (déduites du contenu par défaut)
+
+    Returns:
+        Lignes alignées séparées par des retours à la ligne
+    """
+    from rich.cells import cell_len
+
+    # Chaque cellule n'est mesurée qu'une fois (largeur affichée : emojis sur 2 cellules),
+    # puis réutilisée pour le calcul des colonnes et le remplissage
+    sizes = [[cell_len(cell) for cell in row] for row in rows]
+    if widths is None:
+        widths = [max(column) for column in zip(*sizes)]
+
+    lines = []
+    for row, row_sizes in zip(rows, sizes):
+        cells = [cell + ' ' * (width - size) for cell, size, width in zip(row[:-1], row_sizes, widths)]
+        lines.append('  '.join(cells + [row[-1]]))
+    lines.insert(1, '  '.join('─' * width for width in widths))
+    return '\n'.join(lines)
+
+@lru_cache(maxsize=1)
 def get_system_info():
-    """Détecte les informations système"""
-    return {
+    """
+    Détecte les informations système (une seule fois par exécution de la CLI)
+    L'espace disque, plus coûteux (statvfs), est fourni à part par _get_disk_gb
+    """
+    import platform
+    import psutil
+    return MappingProxyType({
         'ram_gb': psutil.virtual_memory().total / (1024**3),
         'cpu_count': psutil.cpu_count(),
         'os': platform.system(),
-        'python': platform.python_version(),
-        'disk_gb': psutil.disk_usage('/').total / (1024**3)
-    }
+        'python': platform.python_version()
+    })
+
+@lru_cache(maxsize=1)
+def _get_disk_gb():
+    """Taille totale du disque racine en Go (utilisée par la commande status uniquement)"""
+    import psutil
+    return psutil.disk_usage('/').total / (1024**3)
 
+@lru_cache(maxsize=1)
 def recommend_mode():
     """Recommande le mode optimal selon les ressources"""
-    ram_gb = psutil.virtual_memory().total / (1024**3)
+    ram_gb = get_system_info()['ram_gb']
     if ram_gb < 12:
         return "light"
     elif ram_gb < 24:
@@ -92,9 +266,7 @@ def recommend_mode():
     else:
         return "advanced"
 
-def show_welcome():
-    """Affiche l'écran d'accueil EcoAgent"""
-    logo = """
+_LOGO = """
     ╔══════════════════════════════════════════════════════════════╗
     ║                  🤖 EcoAgent Framework                       ║
     ║             Alternative économique aux IA payantes          ║
@@ -105,20 +277,31 @@ def show_welcome():
     ║  ✅ Coûts Transparents      ✅ Génération Ultra-Rapide     ║
     ╚══════════════════════════════════════════════════════════════╝
     """
-    
-    console.print(Panel(
-        logo,
+
+# Panneaux de l'accueil construits une seule fois par processus (rich.panel reste
+# importé à la demande, d'où des fonctions mémoïsées plutôt que des constantes)
+@lru_cache(maxsize=1)
+def _logo_panel():
+    """Panneau du logo (constant)"""
+    from rich.panel import Panel
+    return Panel(
+        _LOGO,
         title="[bold blue]Bienvenue[/bold blue]",
         border_style="blue",
         padding=(1, 2)
-    ))
+    )
+
+@lru_cache(maxsize=1)
+def _system_panel():
+    """Panneau d'état du système (données constantes pendant l'exécution de la CLI)"""
+    from rich.panel import Panel
     
     # Détection environnement
     env_info = get_system_info()
     mode = recommend_mode()
     
     # Vérification du framework existant
-    eco_integration = EcoAgentCLIIntegration()
+    eco_integration = _get_integration()
     framework_status = eco_integration.get_framework_status()
     
     info_text = f"""
@@ -131,26 +314,31 @@ RAM: {env_info['ram_gb']:.1f} GB | OS: {env_info['os']} | Python: {env_info['pyt
 [bold blue]📊 Agents disponibles:[/bold blue] {framework_status['agents_count']}/8
 """
     
-    console.print(Panel(
+    return Panel(
         info_text,
         title="[bold cyan]État du système[/bold cyan]",
         border_style="cyan"
-    ))
+    )
 
-def create_project_files(project_name, template, framework, output_dir):
-    """Génère directement les fichiers du projet"""
-    from pathlib import Path
+def show_welcome(quiet: bool = False):
+    """
+    Affiche l'écran d'accueil EcoAgent
+    Omis avec --quiet et hors terminal (sortie redirigée vers un fichier ou un script) :
+    la détection système et l'état du framework ne sont alors pas calculés
+    """
+    if quiet or not console.is_terminal:
+        return
     
-    try:
-        # Création des dossiers
-        project_path = Path(output_dir) / project_name
-        backend_path = project_path / "backend"
-        backend_path.mkdir(parents=True, exist_ok=True)
-        
-        console.print(f"[green]✅ Dossiers créés: {project_path}[/green]")
-        
-        # Fichier main.py
-        main_content = """#!/usr/bin/env python3
+    system_panel = _system_panel()
+    
+    # Les deux panneaux sont écrits en une fois
+    with console:
+        console.print(_logo_panel())
+        console.print(system_panel)
+
+# Fichiers du squelette de projet : main.py et requirements.txt sont constants
+# (encodés une fois), seul le README dépend du projet
+_MAIN_PY_TEMPLATE = """#!/usr/bin/env python3
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
@@ -187,19 +375,49 @@ if __name__ == "__main__":
     print("📚 Documentation: http://localhost:8000/docs")
     uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
 """
+_MAIN_PY_BYTES = _MAIN_PY_TEMPLATE.encode('utf-8')
+
+_REQS_TXT = "fastapi>=0.104.0\nuvicorn[standard]>=0.24.0\npython-multipart>=0.0.6\npydantic>=2.4.0\n"
+_REQS_BYTES = _REQS_TXT.encode('utf-8')
+
+_README_TEMPLATE = string.Template(
+    "# $project_name\n\nApplication $template générée par EcoAgent Framework v2.0\n\n"
+    "## Démarrage\n\ncd backend\npip install -r requirements.txt\npython main.py\n\n"
+    "Accès: http://localhost:8000\n"
+)
+
+# Nom de projet : lettres/chiffres Unicode, - et _, avec au moins une lettre ou un chiffre
+# ([^\W_] correspond exactement à str.isalnum)
+_VALID_NAME_RE = re.compile(r'\A(?=[\w-]*[^\W_])[\w-]+\Z')
+
+# Squelette constant (chemin relatif au projet, contenu encodé) ; le README, seul
+# fichier dépendant du projet, est ajouté à l'écriture
+_SKELETON_FILES = (
+    ("backend/main.py", _MAIN_PY_BYTES),
+    ("backend/requirements.txt", _REQS_BYTES)
+)
+
+def create_project_files(project_name, template, framework, output_dir):
+    """Génère directement les fichiers du projet"""
+    from pathlib import Path
+    
+    try:
+        # Création des dossiers
+        project_path = Path(output_dir) / project_name
+        backend_path = project_path / "backend"
+        backend_path.mkdir(parents=True, exist_ok=True)
         
-        (backend_path / "main.py").write_text(main_content)
-        console.print(f"[green]✅ main.py créé[/green]")
+        console.print(f"[green]✅ Dossiers créés: {project_path}[/green]")
         
-        # Requirements.txt
-        requirements = "fastapi>=0.104.0\nuvicorn[standard]>=0.24.0\npython-multipart>=0.0.6\npydantic>=2.4.0\n"
-        (backend_path / "requirements.txt").write_text(requirements)
-        console.print(f"[green]✅ requirements.txt créé[/green]")
+        readme = _README_TEMPLATE.substitute(project_name=project_name, template=template)
         
-        # README.md
-        readme = f"# {project_name}\n\nApplication {template} générée par EcoAgent Framework v2.0\n\n## Démarrage\n\ncd backend\npip install -r requirements.txt\npython main.py\n\nAccès: http://localhost:8000\n"
-        (project_path / "README.md").write_text(readme)
-        console.print(f"[green]✅ README.md créé[/green]")
+        # Écriture groupée : contenu complet par fichier, un seul message récapitulatif
+        files = [(project_path / relative, content) for relative, content in _SKELETON_FILES]
+        files.append((project_path / "README.md", readme.encode('utf-8')))
+        for path, content in files:
+            path.write_bytes(content)
+        
+        console.print(f"[green]✅ Fichiers créés: {', '.join(path.name for path, _ in files)}[/green]")
         
         return True
         
@@ -215,7 +433,9 @@ def create(
     framework: Optional[str] = typer.Option("fastapi-react", "--framework", "-f", help="Framework à utiliser"),
     mode: Optional[str] = typer.Option(None, "--mode", "-m", help="Mode opérationnel"),
     dry_run: bool = typer.Option(False, "--dry-run", help="Simulation sans génération réelle"),
-    output_dir: Optional[str] = typer.Option(".", "--output", "-o", help="Dossier de sortie")
+    output_dir: Optional[str] = typer.Option(".", "--output", "-o", help="Dossier de sortie"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Répondre oui aux confirmations"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Ne pas afficher l'écran d'accueil")
 ):
     """
     🚀 Créer une nouvelle application avec EcoAgent
@@ -225,12 +445,12 @@ def create(
     ecoagent create "shop-online" --template ecommerce --mode standard
     ecoagent create "test-app" --dry-run
     """
-    show_welcome()
+    show_welcome(quiet)
     
     console.print(f"\n[bold green]🚀 Création du projet:[/bold green] [cyan]{project_name}[/cyan]")
     
     # Validation du nom de projet
-    if not project_name.replace('-', '').replace('_', '').isalnum():
+    if not _VALID_NAME_RE.match(project_name):
         console.print("[red]❌ Nom de projet invalide (utilisez lettres, chiffres, - et _)[/red]")
         raise typer.Exit(1)
     
@@ -239,25 +459,25 @@ def create(
         mode = recommend_mode()
         console.print(f"[blue]🔍 Mode auto-détecté:[/blue] [bold]{mode}[/bold]")
     
-    # Vérification du template (utilise TEMPLATES global)
-    if template not in TEMPLATES:
+    # Vérification du template (registre global)
+    if template not in _CREATE_TEMPLATES:
         console.print(f"[red]❌ Template '{template}' non trouvé[/red]")
-        console.print(f"[yellow]💡 Templates disponibles:[/yellow] {', '.join(TEMPLATES.keys())}")
+        console.print(f"[yellow]💡 Templates disponibles:[/yellow] {', '.join(_CREATE_TEMPLATES)}")
         raise typer.Exit(1)
     
     # Affichage des informations du template
-    template_info = TEMPLATES[template]
-    console.print(f"[blue]📋 Template:[/blue] {template_info['desc']}")
+    template_info = _CREATE_TEMPLATES[template]
+    console.print(f"[blue]📋 Template:[/blue] {template_info.summary}")
     console.print(f"[blue]🔧 Framework:[/blue] {framework}")
     console.print(f"[blue]⚙️ Mode:[/blue] {mode}")
     console.print(f"[blue]📁 Dossier de sortie:[/blue] {output_dir}")
     
     # Estimation des coûts
-    estimated_cost = template_info['cost']
+    estimated_cost = template_info.cost_eur
     console.print(f"\n[bold yellow]💰 Coût estimé:[/bold yellow] [green]{estimated_cost:.2f}€[/green]")
     
     if estimated_cost > 0 and not dry_run:
-        if not Confirm.ask(f"Continuer avec un coût de {estimated_cost:.2f}€ ?"):
+        if not _confirm(f"Continuer avec un coût de {estimated_cost:.2f}€ ?", yes):
             console.print("[yellow]Génération annulée par l'utilisateur[/yellow]")
             raise typer.Exit(0)
     
@@ -281,104 +501,11 @@ def create(
         console.print("[yellow]Mode simulation - aucun fichier créé[/yellow]")
 
 
-async def generate_project(
-    project_name: str, template: str, framework: str, 
-    mode: str, dry_run: bool, output_dir: str
-):
-    """Génère le projet avec vos agents existants et indicateurs de progression"""
-    
-    # Initialisation de l'intégration avec votre framework
-    eco_integration = EcoAgentCLIIntegration()
-    framework_status = eco_integration.get_framework_status()
-    
-    console.print(f"\n[blue]🔗 Intégration framework:[/blue] {'✅ Agents EcoAgent' if framework_status['framework_available'] else '⚠️  Mode CLI seul'}")
-    
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeElapsedColumn(),
-        console=console
-    ) as progress:
-        
-        # Étapes de génération
-        steps = [
-            ("🔍 Analyse du projet", 2),
-            ("🏗️ Architecture système", 3),
-            ("💻 Génération backend", 4),
-            ("🎨 Génération frontend", 4),
-            ("🐳 Configuration Docker", 2),
-            ("🧪 Génération tests", 3),
-            ("📚 Documentation", 2)
-        ]
-        
-        project_result = None
-        
-        for step_name, duration in steps:
-            task = progress.add_task(step_name, total=100)
-            
-            # Étape spécifique d'intégration avec votre framework
-            if step_name == "🔍 Analyse du projet" and not dry_run:
-                try:
-                    project_result = eco_integration.create_project_with_existing_framework(
-                        project_name, template, framework, mode
-                    )
-                except Exception as e:
-                    console.print(f"[yellow]⚠️  Erreur intégration framework: {e}[/yellow]")
-                    project_result = {'success': False, 'fallback': True}
-            
-            # Simulation de progression
-            for i in range(100):
-                await asyncio.sleep(duration/100)
-                progress.update(task, advance=1)
-    
-    # Résumé final
-    console.print(f"\n[bold green]🎉 Projet '{project_name}' créé avec succès ![/bold green]")
-    
-    if not dry_run:
-        project_path = Path(output_dir) / project_name
-        
-        # Création du dossier de base si nécessaire
-        project_path.mkdir(exist_ok=True)
-        
-        # Résumé des résultats
-        summary_table = Table(title="Résumé de génération")
-        summary_table.add_column("Élément", style="cyan")
-        summary_table.add_column("Statut", style="green")
-        summary_table.add_column("Détails", style="yellow")
-        
-        summary_table.add_row("📁 Dossier projet", "✅ Créé", str(project_path))
-        summary_table.add_row("🤖 Framework utilisé", 
-                             "✅ EcoAgent" if framework_status['framework_available'] else "⚠️  CLI seul", 
-                             f"{framework_status['agents_count']}/8 agents")
-        summary_table.add_row("📋 Template", "✅ Appliqué", template)
-        summary_table.add_row("🔧 Framework", "✅ Configuré", framework)
-        # CORRECTION ligne 312 :
-        summary_table.add_row("💰 Coût final", "✅ Respecté", f"{TEMPLATES.get(template, {}).get('cost', 0):.2f}€")
-        
-        console.print(summary_table)
-        
-        console.print(f"\n[bold blue]🚀 Pour démarrer votre projet:[/bold blue]")
-        console.print(f"[cyan]cd {project_path}[/cyan]")
-        
-        if framework_status['framework_available']:
-            console.print("[cyan]python main.py  # Démarrage avec EcoAgent[/cyan]")
-        else:
-            console.print("[cyan]# Suivez les instructions dans le README.md[/cyan]")
-        
-        console.print(f"[cyan]# Puis ouvrez: http://localhost:3000[/cyan]")
-        
-    else:
-        console.print("[yellow]🔍 Mode simulation terminé - Aucun fichier créé[/yellow]")
-        console.print("[dim]Utilisez la commande sans --dry-run pour créer réellement le projet[/dim]")
-
-# ... [Le reste du code reste identique] ...
-
 @app.command()
 def demo(
     demo_type: Optional[str] = typer.Argument(None, help="Type de démonstration"),
-    list_demos: bool = typer.Option(False, "--list", "-l", help="Lister les démos disponibles")
+    list_demos: bool = typer.Option(False, "--list", "-l", help="Lister les démos disponibles"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Répondre oui aux confirmations")
 ):
     """
     🎨 Générer des applications de démonstration
@@ -388,40 +515,9 @@ def demo(
     ecoagent demo ecommerce
     ecoagent demo blog
     """
-    show_welcome()
+    from rich.table import Table
     
-    demos = {
-        'ecommerce': {
-            'name': 'Boutique E-commerce',
-            'desc': 'Shop en ligne complet avec panier et paiement',
-            'features': ['Catalogue produits', 'Panier d\'achat', 'Paiement Stripe', 'Interface admin'],
-            'cost': 0.5
-        },
-        'blog': {
-            'name': 'Blog Professionnel',
-            'desc': 'Blog moderne avec éditeur et système de commentaires',
-            'features': ['Éditeur riche', 'System de commentaires', 'SEO optimisé', 'Interface admin'],
-            'cost': 0.0
-        },
-        'crm': {
-            'name': 'CRM Entreprise',
-            'desc': 'Système de gestion relation client complet',
-            'features': ['Gestion contacts', 'Suivi opportunités', 'Tableaux de bord', 'Rapports avancés'],
-            'cost': 1.0
-        },
-        'dashboard': {
-            'name': 'Dashboard Analytics',
-            'desc': 'Tableau de bord avec métriques en temps réel',
-            'features': ['Graphiques interactifs', 'KPIs temps réel', 'Alertes', 'Export données'],
-            'cost': 0.3
-        },
-        'portfolio': {
-            'name': 'Site Portfolio',
-            'desc': 'Site portfolio professionnel responsive',
-            'features': ['Galerie projets', 'CV interactif', 'Contact form', 'Blog intégré'],
-            'cost': 0.0
-        }
-    }
+    show_welcome()
     
     if list_demos or not demo_type:
         console.print("\n[bold blue]🎨 Démonstrations disponibles:[/bold blue]")
@@ -432,12 +528,12 @@ def demo(
         table.add_column("Fonctionnalités", style="green", width=35)
         table.add_column("Coût", style="yellow", width=8)
         
-        for key, demo in demos.items():
+        for demo in _DEMO_TEMPLATES.values():
             table.add_row(
-                demo['name'],
-                demo['desc'],
-                ', '.join(demo['features'][:2]) + "...",
-                f"{demo['cost']:.1f}€"
+                demo.demo_title,
+                demo.demo_desc,
+                ', '.join(demo.features[:2]) + "...",
+                f"{demo.cost_eur:.1f}€"
             )
         
         console.print(table)
@@ -446,84 +542,105 @@ def demo(
             console.print(f"\n[dim]Utilisez: ecoagent demo <nom_demo> pour générer une démonstration[/dim]")
             return
     
-    if demo_type and demo_type in demos:
-        demo = demos[demo_type]
-        console.print(f"\n[bold green]🚀 Génération démo:[/bold green] [cyan]{demo['name']}[/cyan]")
-        console.print(f"[white]Description:[/white] {demo['desc']}")
-        console.print(f"[white]Fonctionnalités:[/white] {', '.join(demo['features'])}")
-        console.print(f"[white]Coût estimé:[/white] [yellow]{demo['cost']:.2f}€[/yellow]")
+    if demo_type and demo_type in _DEMO_TEMPLATES:
+        demo = _DEMO_TEMPLATES[demo_type]
+        console.print(f"\n[bold green]🚀 Génération démo:[/bold green] [cyan]{demo.demo_title}[/cyan]")
+        console.print(f"[white]Description:[/white] {demo.demo_desc}")
+        console.print(f"[white]Fonctionnalités:[/white] {', '.join(demo.features)}")
+        console.print(f"[white]Coût estimé:[/white] [yellow]{demo.cost_eur:.2f}€[/yellow]")
         
-        if Confirm.ask("Générer cette démonstration ?"):
+        if _confirm("Générer cette démonstration ?", yes):
+            from ..core.event_loop import run as run_event_loop
+            from .commands.create import generate_project
             project_name = f"demo-{demo_type}-{int(time.time())}"
-            # CORRECTION : Utiliser asyncio.run() au lieu de await direct
-            return asyncio.run(generate_project(project_name, demo_type, "fastapi-react", "standard", False, "."))
+            # CORRECTION : Exécuter la coroutine (uvloop si disponible) au lieu de await direct
+            return run_event_loop(generate_project(project_name, demo_type, "fastapi-react", "standard", False, "."))
     elif demo_type:
         console.print(f"[red]❌ Démo '{demo_type}' non trouvée[/red]")
-        console.print(f"[yellow]💡 Démos disponibles:[/yellow] {', '.join(demos.keys())}")
+        console.print(f"[yellow]💡 Démos disponibles:[/yellow] {', '.join(_DEMO_TEMPLATES)}")
 
 
 @app.command()
+@_batched_output
 def status(
     detailed: bool = typer.Option(False, "--detailed", "-d", help="Affichage détaillé"),
+    pretty: bool = typer.Option(False, "--pretty", help="Affichage en tableaux mis en forme"),
     json_output: bool = typer.Option(False, "--json", help="Sortie JSON")
 ):
     """
     📊 Afficher l'état du framework EcoAgent
     """
-    if not json_output:
-        show_welcome()
-    
-    env_info = get_system_info()
-    eco_integration = EcoAgentCLIIntegration()
+    env_info = {**get_system_info(), 'disk_gb': _get_disk_gb()}
+    eco_integration = _get_integration()
     framework_status = eco_integration.get_framework_status()
     
     if json_output:
+        # Sortie machine : ni accueil, ni rich (pas de coloration ni de retour à la ligne)
+        import json
         status_data = {
             'system': env_info,
             'framework': framework_status,
             'mode_recommended': recommend_mode(),
             'cli_version': '2.0.0'
         }
-        console.print(json.dumps(status_data, indent=2))
+        print(json.dumps(status_data, indent=2))
         return
     
+    show_welcome()
+    
     # Informations système
     console.print("\n[bold blue]💻 Ressources système[/bold blue]")
     
-    system_table = Table()
-    system_table.add_column("Ressource", style="cyan")
-    system_table.add_column("Valeur", style="green")
-    system_table.add_column("Statut", style="yellow")
-    
     ram_status = "✅ Optimal" if env_info['ram_gb'] >= 16 else "⚠️  Limité" if env_info['ram_gb'] >= 8 else "❌ Insuffisant"
     
-    system_table.add_row("RAM", f"{env_info['ram_gb']:.1f} GB", ram_status)
-    system_table.add_row("CPU", f"{env_info['cpu_count']} cœurs", "✅ OK")
-    system_table.add_row("Stockage", f"{env_info['disk_gb']:.0f} GB", "✅ OK")
-    system_table.add_row("OS", env_info['os'], "✅ Compatible")
-    system_table.add_row("Python", env_info['python'], "✅ Compatible")
-    system_table.add_row("Mode recommandé", recommend_mode(), "✅ Auto-détecté")
-    
-    console.print(system_table)
+    system_rows = [
+        ("Ressource", "Valeur", "Statut"),
+        ("RAM", f"{env_info['ram_gb']:.1f} GB", ram_status),
+        ("CPU", f"{env_info['cpu_count']} cœurs", "✅ OK"),
+        ("Stockage", f"{env_info['disk_gb']:.0f} GB", "✅ OK"),
+        ("OS", env_info['os'], "✅ Compatible"),
+        ("Python", env_info['python'], "✅ Compatible"),
+        ("Mode recommandé", recommend_mode(), "✅ Auto-détecté")
+    ]
     
     # État du framework EcoAgent
-    console.print("\n[bold blue]🤖 Framework EcoAgent[/bold blue]")
-    
-    framework_table = Table()
-    framework_table.add_column("Composant", style="cyan")
-    framework_table.add_column("Statut", style="green")
-    framework_table.add_column("Détails", style="white")
-    
-    framework_table.add_row(
-        "Framework principal", 
-        "✅ Disponible" if framework_status['framework_available'] else "⚠️  CLI seul",
-        "Intégration active" if framework_status['framework_available'] else "Mode autonome"
-    )
-    framework_table.add_row("Agents disponibles", f"{framework_status['agents_count']}/8", "Agents EcoAgent")
-    framework_table.add_row("Interface CLI", "✅ Active", "Version 2.0.0")
-    framework_table.add_row("Templates", "✅ 12 disponibles", "Tous types d'applications")
+    framework_rows = [
+        ("Composant", "Statut", "Détails"),
+        (
+            "Framework principal", 
+            "✅ Disponible" if framework_status['framework_available'] else "⚠️  CLI seul",
+            "Intégration active" if framework_status['framework_available'] else "Mode autonome"
+        ),
+        ("Agents disponibles", f"{framework_status['agents_count']}/8", "Agents EcoAgent"),
+        ("Interface CLI", "✅ Active", "Version 2.0.0"),
+        ("Templates", "✅ 12 disponibles", "Tous types d'applications")
+    ]
     
-    console.print(framework_table)
+    if pretty or detailed:
+        from rich.table import Table
+        
+        system_table = Table()
+        system_table.add_column(system_rows[0][0], style="cyan")
+        system_table.add_column(system_rows[0][1], style="green")
+        system_table.add_column(system_rows[0][2], style="yellow")
+        for row in system_rows[1:]:
+            system_table.add_row(*row)
+        console.print(system_table)
+        
+        console.print("\n[bold blue]🤖 Framework EcoAgent[/bold blue]")
+        
+        framework_table = Table()
+        framework_table.add_column(framework_rows[0][0], style="cyan")
+        framework_table.add_column(framework_rows[0][1], style="green")
+        framework_table.add_column(framework_rows[0][2], style="white")
+        for row in framework_rows[1:]:
+            framework_table.add_row(*row)
+        console.print(framework_table)
+    else:
+        # Rendu texte brut : pas de mise en page Table pour deux petits tableaux fixes
+        console.out(_format_columns(system_rows), highlight=False)
+        console.print("\n[bold blue]🤖 Framework EcoAgent[/bold blue]")
+        console.out(_format_columns(framework_rows), highlight=False)
     
     if detailed:
         # État détaillé des agents (si framework disponible)
@@ -558,7 +675,9 @@ def config(
     key: Optional[str] = typer.Argument(None, help="Clé de configuration"),
     value: Optional[str] = typer.Argument(None, help="Valeur à définir"),
     list_config: bool = typer.Option(False, "--list", "-l", help="Lister la configuration"),
-    reset: bool = typer.Option(False, "--reset", help="Remettre à zéro la configuration")
+    reset: bool = typer.Option(False, "--reset", help="Remettre à zéro la configuration"),
+    yes: bool = typer.Option(False, "--yes", "-y", help="Répondre oui aux confirmations"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Ne pas afficher l'écran d'accueil")
 ):
     """
     ⚙️ Gérer la configuration EcoAgent
@@ -569,15 +688,17 @@ def config(
     ecoagent config mode standard
     ecoagent config --reset
     """
-    show_welcome()
+    show_welcome(quiet)
     
     if reset:
-        if Confirm.ask("Remettre à zéro toute la configuration ?"):
+        if _confirm("Remettre à zéro toute la configuration ?", yes):
             console.print("[green]✅ Configuration remise à zéro[/green]")
             console.print("[dim]Paramètres restaurés aux valeurs par défaut[/dim]")
         return
     
     if list_config or (not key and not value):
+        from rich.table import Table
+        
         console.print("\n[bold blue]⚙️ Configuration actuelle[/bold blue]")
         
         config_table = Table()
@@ -623,43 +744,21 @@ def config(
         console.print("[dim]Configuration sauvegardée[/dim]")
 
 @app.command()
+@_batched_output
 def templates(
     category: Optional[str] = typer.Option(None, "--category", "-c", help="Filtrer par catégorie"),
-    search: Optional[str] = typer.Option(None, "--search", "-s", help="Rechercher un template")
+    search: Optional[str] = typer.Option(None, "--search", "-s", help="Rechercher un template"),
+    pretty: bool = typer.Option(False, "--pretty", help="Affichage en tableaux mis en forme"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Ne pas afficher l'écran d'accueil")
 ):
     """
     📋 Lister les templates disponibles
     """
-    show_welcome()
+    show_welcome(quiet)
     
     console.print("\n[bold blue]📋 Templates disponibles[/bold blue]")
     
-    templates_data = {
-        'Web Applications': {
-            'webapp': 'Application web complète FastAPI + React + PostgreSQL',
-            'blog': 'Blog moderne avec CMS intégré et SEO',
-            'portfolio': 'Site portfolio professionnel responsive'
-        },
-        'E-commerce': {
-            'ecommerce': 'Boutique en ligne complète avec paiement',
-            'marketplace': 'Plateforme marketplace multi-vendeurs'
-        },
-        'Business Applications': {
-            'crm': 'Système CRM complet avec pipeline ventes',
-            'erp': 'Solution ERP modulaire pour PME',
-            'inventory': 'Gestion de stock et inventaire avancée'
-        },
-        'APIs & Services': {
-            'api': 'API REST robuste avec documentation',
-            'graphql': 'API GraphQL moderne avec Apollo',
-            'microservice': 'Architecture microservices Docker'
-        },
-        'Analytics & Dashboards': {
-            'dashboard': 'Tableau de bord analytics temps réel',
-            'reporting': 'Système de rapports avancés',
-            'monitoring': 'Monitoring et alertes système'
-        }
-    }
+    templates_data = _TEMPLATE_CATEGORIES
     
     # Filtrage par recherche
     if search:
@@ -672,12 +771,21 @@ def templates(
                 filtered_templates[cat] = filtered
         templates_data = filtered_templates
     
+    if pretty:
+        from rich.table import Table
+    
     for cat, templates in templates_data.items():
         if category and category.lower() not in cat.lower():
             continue
             
         console.print(f"\n[bold yellow]📁 {cat}[/bold yellow]")
         
+        if not pretty:
+            # Catégorie complète : rendu texte calculé une fois, sinon rendu du sous-ensemble filtré
+            text = _category_listing(cat) if templates is _TEMPLATE_CATEGORIES.get(cat) else _format_category(templates)
+            console.out(text, highlight=False)
+            continue
+        
         category_table = Table()
         category_table.add_column("Template", style="cyan", width=15)
         category_table.add_column("Description", style="white", width=50)
@@ -697,39 +805,40 @@ def templates(
     else:
         console.print(f"\n[dim]Total: {sum(len(templates) for templates in templates_data.values())} templates disponibles[/dim]")
 
+def _format_category(templates) -> str:
+    """Rendu texte d'une catégorie de templates (nom, description, commande)"""
+    rows = [("Template", "Description", "Commande")]
+    rows.extend(
+        (template, desc, f"ecoagent create mon-{template} -t {template}")
+        for template, desc in templates.items()
+    )
+    return _format_columns(rows)
+
+@lru_cache(maxsize=None)
+def _category_listing(cat: str) -> str:
+    """Rendu texte d'une catégorie complète du catalogue (statique, calculé une fois)"""
+    return _format_category(_TEMPLATE_CATEGORIES[cat])
+
 @app.command()
+@_batched_output
 def cost(
     project_type: Optional[str] = typer.Option("webapp", "--type", "-t", help="Type de projet"),
-    mode: Optional[str] = typer.Option("standard", "--mode", "-m", help="Mode opérationnel")
+    mode: Optional[str] = typer.Option("standard", "--mode", "-m", help="Mode opérationnel"),
+    quiet: bool = typer.Option(False, "--quiet", "-q", help="Ne pas afficher l'écran d'accueil")
 ):
     """
     💰 Calculer l'estimation des coûts
     """
-    show_welcome()
+    from rich.table import Table
     
-    console.print(f"\n[bold yellow]💰 Estimation des coûts - {project_type} ({mode})[/bold yellow]")
-    
-    # Coûts par type de projet et mode
-    base_costs = {
-        'webapp': {'total': 0.0, 'api_calls': 0, 'local': '100%'},
-        'blog': {'total': 0.0, 'api_calls': 0, 'local': '100%'},
-        'ecommerce': {'total': 0.5, 'api_calls': 5, 'local': '95%'},
-        'crm': {'total': 1.0, 'api_calls': 10, 'local': '90%'},
-        'api': {'total': 0.0, 'api_calls': 0, 'local': '100%'},
-        'dashboard': {'total': 0.3, 'api_calls': 3, 'local': '97%'},
-        'portfolio': {'total': 0.0, 'api_calls': 0, 'local': '100%'}
-    }
+    show_welcome(quiet)
     
-    # Modificateurs par mode
-    mode_multipliers = {
-        'light': 0.8,
-        'standard': 1.0,
-        'advanced': 1.2
-    }
+    console.print(f"\n[bold yellow]💰 Estimation des coûts - {project_type} ({mode})[/bold yellow]")
     
-    base_cost = base_costs.get(project_type, base_costs['webapp'])
-    multiplier = mode_multipliers.get(mode, 1.0)
-    final_cost = base_cost['total'] * multiplier
+    # Coûts par type de projet (registre des templates, webapp par défaut)
+    base_cost = _TEMPLATE_REGISTRY.get(project_type, _DEFAULT_SPEC)
+    multiplier = _MODE_MULTIPLIERS.get(mode, 1.0)
+    final_cost = base_cost.cost_eur * multiplier
     
     cost_table = Table()
     cost_table.add_column("Composant", style="cyan")
@@ -741,7 +850,7 @@ def cost(
     cost_table.add_row("Documentation", "0.00€", "Local")
     cost_table.add_row("Optimisations IA", f"{final_cost:.2f}€", "API" if final_cost > 0 else "Local")
     cost_table.add_row("", "", "", style="dim")
-    cost_table.add_row("TOTAL", f"{final_cost:.2f}€", f"{base_cost['local']} local", style="bold green")
+    cost_table.add_row("TOTAL", f"{final_cost:.2f}€", f"{base_cost.local_share} local", style="bold green")
     
     console.print(cost_table)
     
@@ -753,34 +862,29 @@ def cost(
     comp_table.add_column("Coût/mois", style="red")
     comp_table.add_column("Économie vs EcoAgent", style="green")
     
-    competitors = [
-        ("GitHub Copilot", "39.00€", f"+{39.00 - final_cost:.2f}€"),
-        ("Cursor Pro", "20.00€", f"+{20.00 - final_cost:.2f}€"),
-        ("Claude Pro", "18.00€", f"+{18.00 - final_cost:.2f}€"),
-        ("ChatGPT Plus", "20.00€", f"+{20.00 - final_cost:.2f}€"),
-        ("EcoAgent", f"{final_cost:.2f}€", "Référence")
-    ]
-    
-    for solution, cost_val, saving in competitors:
-        style = "bold green" if solution == "EcoAgent" else "white"
-        comp_table.add_row(solution, cost_val, saving, style=style)
+    for solution, price, price_label in _COMPETITORS:
+        comp_table.add_row(solution, price_label, f"+{price - final_cost:.2f}€", style="white")
+    comp_table.add_row("EcoAgent", f"{final_cost:.2f}€", "Référence", style="bold green")
     
     console.print(comp_table)
     
     # Détails du calcul
     if final_cost > 0:
         console.print(f"\n[bold blue]🔍 Détail du calcul[/bold blue]")
-        console.print(f"[white]Base {project_type}:[/white] {base_cost['total']:.2f}€")
+        console.print(f"[white]Base {project_type}:[/white] {base_cost.cost_eur:.2f}€")
         console.print(f"[white]Multiplicateur {mode}:[/white] x{multiplier}")
-        console.print(f"[white]Appels API estimés:[/white] {int(base_cost['api_calls'] * multiplier)}")
-        console.print(f"[white]Traitement local:[/white] {base_cost['local']}")
+        console.print(f"[white]Appels API estimés:[/white] {int(base_cost.api_calls * multiplier)}")
+        console.print(f"[white]Traitement local:[/white] {base_cost.local_share}")
 
 
 @app.command()
+@_batched_output
 def version():
     """
     ℹ️ Afficher la version d'EcoAgent
     """
+    from rich.panel import Panel
+    
     version_info = {
         "version": "2.0.0",
         "build": "stable",
@@ -0,0 +1,27 @@
+"""
+EcoAgent Framework - Boucle d'événements
+Point d'entrée unique pour exécuter les coroutines du framework
+"""
+
+import asyncio
+from typing import Any, Awaitable
+
+try:
+    # Boucle libuv : ordonnancement des tâches et des await nettement plus rapide
+    import uvloop
+except ImportError:  # Windows ou extra "fast" non installé
+    uvloop = None
+
+def run(main: Awaitable[Any]) -> Any:
+    """
+    Exécute une coroutine jusqu'à son terme, avec uvloop si disponible
+
+    Args:
+        main: Coroutine principale (ex: generate_project(...))
+
+    Returns:
+        Valeur retournée par la coroutine
+    """
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(main)
@@ -24,6 +24,14 @@ class ResourceManager:
         self.logger = logging.getLogger(__name__)
         self._system_info = self._detect_system()
         self._resource_tier = self._determine_tier()
+        # Incrémenté à chaque nouvelle détection : invalide les configurations mises en cache
+        self.config_version = 0
+    
+    def refresh(self):
+        """Relance la détection des ressources et invalide les caches dépendants"""
+        self._system_info = self._detect_system()
+        self._resource_tier = self._determine_tier()
+        self.config_version += 1
         
     def _detect_system(self) -> Dict:
         """Détecte les spécifications du système"""
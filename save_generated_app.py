@@ -3,7 +3,6 @@
 Script pour sauvegarder une application générée sur le disque
 """
 
-import asyncio
 import os
 import sys
 
@@ -12,6 +11,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from ecoagent.agents.analysis_agent import analysis_agent
 from ecoagent.agents.architect_agent import architect_agent
 from ecoagent.agents.coder_agent import coder_agent
+from ecoagent.core.event_loop import run as run_event_loop
 
 async def generate_and_save_app():
     print("🏗️  Génération et sauvegarde d'une application complète")
@@ -60,15 +60,7 @@ async def generate_and_save_app():
         
         print(f"\n💾 Sauvegarde de {len(generated_files)} fichiers dans '{output_dir}'...")
         
-        for file_path, content in generated_files.items():
-            # Créer les dossiers nécessaires
-            full_path = os.path.join(output_dir, file_path)
-            os.makedirs(os.path.dirname(full_path), exist_ok=True)
-            
-            # Sauvegarder le fichier
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
+        for file_path in coder_agent.write_files(generated_files, output_dir):
             print(f"   ✅ {file_path}")
         
         print(f"\n🎉 Application sauvegardée dans le dossier '{output_dir}'!")
@@ -90,4 +82,4 @@ async def generate_and_save_app():
         return None, None
 
 if __name__ == "__main__":
-    asyncio.run(generate_and_save_app())
+    run_event_loop(generate_and_save_app())
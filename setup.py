@@ -46,6 +46,10 @@ setup(
             'black>=22.0.0',
             'flake8>=4.0.0',
         ],
+        # Boucle d'événements libuv (ignorée sous Windows)
+        'fast': [
+            'uvloop>=0.17.0; sys_platform != "win32"',
+        ],
     },
     
     include_package_data=True,
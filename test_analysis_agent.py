@@ -4,13 +4,14 @@ Test de l'agent d'analyse
 """
 
 import asyncio
+import copy
 import sys
 import os
 
 # Ajout du chemin du projet
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from ecoagent.agents.analysis_agent import analysis_agent
+from ecoagent.agents.analysis_agent import AnalysisAgent, analysis_agent
 
 async def test_analysis():
     print("🧪 Test de l'Agent d'Analyse")
@@ -67,5 +68,26 @@ async def test_analysis():
     print(f"Taux de succès: {perf['success_rate_percent']}%")
     print(f"Coût total: {perf['total_cost_euros']}€")
 
+def test_results_are_independent_copies():
+    """Modifier un résultat ne doit altérer ni le cache ni les tables partagées"""
+    description = 'Créer une application web qui doit gérer des utilisateurs avec base de données'
+    other = 'Site web vitrine application web avec formulaire'
+    agent = AnalysisAgent()
+    expected = copy.deepcopy(agent.execute_task_sync({'description': description}))
+    expected_other = copy.deepcopy(AnalysisAgent().execute_task_sync({'description': other}))
+    
+    result = agent.execute_task_sync({'description': description})
+    result['action_plan'][0]['status'] = 'modifié'
+    result['action_plan'].append({'step': 'modifié'})
+    result['technical_stack']['backend'] = 'modifié'
+    result['resource_estimate']['time_hours'] = 999
+    result['requirements']['functional'].append('modifié')
+    
+    # Même appel (cache de l'instance) et autre instance (tables de classe)
+    assert agent.execute_task_sync({'description': description}) == expected
+    assert AnalysisAgent().execute_task_sync({'description': other}) == expected_other
+    print("✅ Résultats indépendants: cache et tables partagées intacts")
+
 if __name__ == "__main__":
     asyncio.run(test_analysis())
+    test_results_are_independent_copies()
@@ -4,13 +4,14 @@ Test de l'agent architecte
 """
 
 import asyncio
+import copy
 import sys
 import os
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from ecoagent.agents.analysis_agent import analysis_agent
-from ecoagent.agents.architect_agent import architect_agent
+from ecoagent.agents.architect_agent import ArchitectAgent, architect_agent
 
 async def test_architect_with_analysis():
     print("🏗️  Test de l'Agent Architecte")
@@ -79,5 +80,32 @@ async def test_architect_with_analysis():
     perf = architect_agent.get_performance_summary()
     print(f"   Tâches: {perf['total_tasks']} | Succès: {perf['success_rate_percent']}% | Coût: {perf['total_cost_euros']}€")
 
+def test_designs_are_independent_copies():
+    """Modifier une architecture rendue ne doit altérer ni le cache ni les tables partagées"""
+    def task(project_type):
+        return {'context': {'analysis': {
+            'project_type': project_type,
+            'complexity': 'complex',
+            'requirements': {'functional': ['gérer les utilisateurs et tâches'], 'technical': ['database auth']}
+        }}}
+    
+    agent = ArchitectAgent()
+    expected = copy.deepcopy(agent.execute_task_sync(task('web_application')))
+    expected_other = copy.deepcopy(ArchitectAgent().execute_task_sync(task('api')))
+    
+    result = agent.execute_task_sync(task('web_application'))
+    result['technology_stack']['backend'] = 'modifié'
+    result['api_design']['endpoints'][0]['path'] = 'modifié'
+    result['dependencies']['core'].append('modifié')
+    result['project_structure']['layers'].append('modifié')
+    result['database_design']['relationships'][0]['type'] = 'modifié'
+    result['deployment_strategy']['platform'] = 'modifié'
+    
+    # Même appel (cache de l'instance) et autre instance (tables de classe)
+    assert agent.execute_task_sync(task('web_application')) == expected
+    assert ArchitectAgent().execute_task_sync(task('api')) == expected_other
+    print("✅ Architectures indépendantes: cache et tables partagées intacts")
+
 if __name__ == "__main__":
     asyncio.run(test_architect_with_analysis())
+    test_designs_are_independent_copies()
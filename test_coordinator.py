@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test du coordinateur (agents factices : aucun appel de modèle)
+"""
+
+import asyncio
+import gc
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ecoagent.agents.base_agent import BaseAgent
+from ecoagent.agents.coordinator import AgentCoordinator
+
+class StubAgent(BaseAgent):
+    """Agent factice : attend `delay` secondes puis réussit (ou lève si `fail`)"""
+
+    def __init__(self, name: str, delay: float = 0.0, fail: bool = False):
+        super().__init__(name=name, description=f"Agent factice {name}", model_preference="local")
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.started_at = None
+        self.finished_at = None
+
+    async def execute_task(self, task):
+        self.calls += 1
+        self.started_at = time.perf_counter()
+        await asyncio.sleep(self.delay)
+        self.finished_at = time.perf_counter()
+        if self.fail:
+            raise RuntimeError(f"échec simulé de {self.name}")
+        return {
+            'success': True,
+            'output': {'step': self.name, 'inputs': sorted(task['context'].keys()), 'nested': {'items': [1]}}
+        }
+
+    def can_handle_task(self, task):
+        return True
+
+    def estimate_task_cost(self, task):
+        return 0.01
+
+def make_coordinator(steps, delays=None, failing=()):
+    """Coordinateur avec un agent factice par étape"""
+    delays = delays or {}
+    coordinator = AgentCoordinator()
+    agents = {}
+    for name in steps:
+        agents[name] = StubAgent(name, delay=delays.get(name, 0.0), fail=name in failing)
+        coordinator.register_agent(agents[name])
+    return coordinator, agents
+
+WEB_APP_STEPS = ['analysis', 'architect', 'coder', 'tester', 'documenter']
+FULL_PROJECT_STEPS = ['analysis', 'architect', 'coder', 'reviewer', 'tester', 'documenter', 'git']
+
+def test_level_runs_concurrently():
+    """tester et documenter (même niveau) s'exécutent en parallèle"""
+    async def scenario():
+        coordinator, agents = make_coordinator(WEB_APP_STEPS, delays={'tester': 0.3, 'documenter': 0.3})
+        start = time.perf_counter()
+        result = await coordinator.execute_task({'workflow_type': 'web_app', 'description': 'niveaux'})
+        return result, agents, time.perf_counter() - start
+
+    result, agents, elapsed = asyncio.run(scenario())
+    assert result['success']
+    assert result['steps_completed'] == WEB_APP_STEPS
+    # Les intervalles d'exécution se chevauchent, et la durée est celle d'une seule étape
+    tester, documenter = agents['tester'], agents['documenter']
+    assert tester.started_at < documenter.finished_at and documenter.started_at < tester.finished_at
+    assert elapsed < 0.55, f"niveau exécuté en série ({elapsed:.2f}s)"
+    # Chaque étape ne reçoit que les sorties de ses étapes amont
+    assert result['outputs']['coder']['inputs'] == ['analysis', 'architect']
+    assert result['outputs']['tester']['inputs'] == ['analysis', 'architect', 'coder']
+    print(f"✅ Niveau parallèle: {elapsed:.2f}s pour 2 étapes de 0.3s")
+
+def test_non_critical_failure_continues():
+    """Un échec non critique (tester) n'arrête pas le workflow mais le marque en échec"""
+    async def scenario():
+        coordinator, agents = make_coordinator(FULL_PROJECT_STEPS, failing={'tester'})
+        result = await coordinator.execute_task({'workflow_type': 'full_project', 'description': 'non critique'})
+        return result, agents
+
+    result, agents = asyncio.run(scenario())
+    assert not result['success']
+    assert result['steps_failed'] == ['tester']
+    assert result['steps_completed'] == ['analysis', 'architect', 'coder', 'reviewer', 'documenter', 'git']
+    # Les autres étapes du niveau ont abouti et le niveau suivant a été débloqué
+    assert agents['git'].calls == 1
+    assert 'tester' not in result['outputs']['git']['inputs']
+    print(f"✅ Échec non critique: {result['steps_failed']} | terminées: {len(result['steps_completed'])}")
+
+def test_critical_failure_stops_workflow():
+    """Un échec critique (architect) arrête le workflow après son niveau"""
+    async def scenario():
+        coordinator, agents = make_coordinator(WEB_APP_STEPS, failing={'architect'})
+        result = await coordinator.execute_task({'workflow_type': 'web_app', 'description': 'critique'})
+        return result, agents
+
+    result, agents = asyncio.run(scenario())
+    assert not result['success']
+    assert result['steps_completed'] == ['analysis']
+    assert result['steps_failed'] == ['architect']
+    assert all(agents[name].calls == 0 for name in ('coder', 'tester', 'documenter'))
+    print(f"✅ Échec critique: arrêt après {result['steps_failed']}")
+
+def test_missing_agents_fail_fast():
+    """Un agent manquant fait échouer le workflow avant toute exécution"""
+    async def scenario():
+        coordinator, agents = make_coordinator(['analysis'])
+        result = await coordinator.execute_task({'workflow_type': 'simple_task', 'description': 'manquant'})
+        return result, agents
+
+    result, agents = asyncio.run(scenario())
+    assert not result['success']
+    assert result['missing'] == ['coder']
+    assert agents['analysis'].calls == 0
+    print(f"✅ Agents manquants détectés: {result['missing']}")
+
+def test_collected_agent_fails_fast():
+    """Un agent non épinglé collecté est signalé manquant, même après une première validation"""
+    async def scenario():
+        coordinator, _ = make_coordinator(['analysis'])
+        coder = StubAgent('coder')
+        coordinator.register_agent(coder, pin=False)
+        task = {'workflow_type': 'simple_task', 'description': 'collecte'}
+        first = await coordinator.execute_task(task)
+        del coder
+        gc.collect()
+        second = await coordinator.execute_task(task)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first['success']
+    assert not second['success']
+    assert second['missing'] == ['coder']
+    print(f"✅ Agent collecté détecté: {second['missing']}")
+
+def test_step_cache_reuses_results():
+    """Un workflow identique réutilise les sorties en cache, sans partage d'état mutable"""
+    async def scenario():
+        coordinator, agents = make_coordinator(WEB_APP_STEPS)
+        task = {'workflow_type': 'web_app', 'description': 'cache'}
+        first = await coordinator.execute_task(task)
+        # Modifier une sortie reçue ne doit pas altérer l'entrée du cache
+        first['outputs']['coder']['nested']['items'].append(99)
+        second = await coordinator.execute_task(task)
+        return first, second, agents
+
+    first, second, agents = asyncio.run(scenario())
+    assert first['total_cost'] > 0
+    assert second['success']
+    assert second['total_cost'] == 0.0
+    assert all(agent.calls == 1 for agent in agents.values())
+    assert second['outputs']['coder']['nested'] == {'items': [1]}
+    print(f"✅ Cache d'étapes: coût {first['total_cost']:.2f}€ puis {second['total_cost']:.2f}€")
+
+def test_statistics_and_history():
+    """Compteurs à jour dès le retour de execute_task, historique après flush_events"""
+    async def scenario():
+        coordinator, _ = make_coordinator(WEB_APP_STEPS)
+        await coordinator.execute_task({'workflow_type': 'web_app', 'description': 'stats'})
+        status = coordinator.get_system_status()
+        await coordinator.flush_events()
+        return coordinator, status
+
+    coordinator, status = asyncio.run(scenario())
+    assert status['total_workflows'] == 1
+    assert status['successful_workflows'] == 1
+    assert len(coordinator.workflow_history) == 1
+    print(f"✅ Statistiques: {status['total_workflows']} workflow(s), historique: {len(coordinator.workflow_history)}")
+
+if __name__ == "__main__":
+    print("🎯 Test du Coordinateur")
+    print("=" * 50)
+    test_level_runs_concurrently()
+    test_non_critical_failure_continues()
+    test_critical_failure_stops_workflow()
+    test_missing_agents_fail_fast()
+    test_collected_agent_fails_fast()
+    test_step_cache_reuses_results()
+    test_statistics_and_history()